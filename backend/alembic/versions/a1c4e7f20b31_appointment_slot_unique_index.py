@@ -0,0 +1,26 @@
+"""Unique partial index on booked appointment slots
+
+Revision ID: a1c4e7f20b31
+Revises:
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from alembic import op
+
+
+revision = "a1c4e7f20b31"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_appt_provider_slot "
+        "ON appointments (provider_id, scheduled_at) "
+        "WHERE status <> 'cancelled'"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_appt_provider_slot")
@@ -0,0 +1,28 @@
+"""Partial index for consent renewal lookups
+
+Revision ID: a6c3e1f8d274
+Revises: f2b8d4e6a913
+Create Date: 2026-10-15 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "a6c3e1f8d274"
+down_revision = "f2b8d4e6a913"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_consents_expires_at_unrevoked",
+        "consents",
+        ["expires_at", "patient_id"],
+        postgresql_where=sa.text("revoked_at IS NULL AND expires_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_consents_expires_at_unrevoked", table_name="consents")
@@ -0,0 +1,27 @@
+"""Trigram GIN index for patient search
+
+Revision ID: b7d2f9a4c812
+Revises: a1c4e7f20b31
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from alembic import op
+
+
+revision = "b7d2f9a4c812"
+down_revision = "a1c4e7f20b31"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_patient_search_trgm ON patients USING gin ("
+        "(first_name || ' ' || last_name || ' ' || coalesce(phone, '') || ' ' || "
+        "coalesce(email, '') || ' ' || coalesce(abha_number, '')) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_patient_search_trgm")
@@ -0,0 +1,26 @@
+"""Composite indexes for keyset pagination
+
+Revision ID: c3e8a5d1f607
+Revises: b7d2f9a4c812
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from alembic import op
+
+
+revision = "c3e8a5d1f607"
+down_revision = "b7d2f9a4c812"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_appointments_scheduled_at_id", "appointments", ["scheduled_at", "id"])
+    op.create_index("ix_encounters_created_at_id", "encounters", ["created_at", "id"])
+    op.create_index("ix_patients_created_at_id", "patients", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_patients_created_at_id", table_name="patients")
+    op.drop_index("ix_encounters_created_at_id", table_name="encounters")
+    op.drop_index("ix_appointments_scheduled_at_id", table_name="appointments")
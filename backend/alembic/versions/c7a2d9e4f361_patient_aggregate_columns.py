@@ -0,0 +1,54 @@
+"""Columns for persisting the Patient aggregate
+
+Revision ID: c7a2d9e4f361
+Revises: a6c3e1f8d274
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "c7a2d9e4f361"
+down_revision = "a6c3e1f8d274"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("patients", sa.Column("middle_name", sa.String(100), nullable=True))
+    op.add_column("patients", sa.Column("verified_at", sa.DateTime(), nullable=True))
+    op.add_column("patients", sa.Column("last_activity_at", sa.DateTime(), nullable=True))
+    op.add_column(
+        "patients",
+        sa.Column(
+            "emergency_contacts",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+        ),
+    )
+    op.add_column(
+        "patients",
+        sa.Column(
+            "medical_history",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+    )
+    op.add_column(
+        "patients",
+        sa.Column("version", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.execute("UPDATE patients SET last_activity_at = created_at WHERE last_activity_at IS NULL")
+
+
+def downgrade() -> None:
+    op.drop_column("patients", "version")
+    op.drop_column("patients", "medical_history")
+    op.drop_column("patients", "emergency_contacts")
+    op.drop_column("patients", "last_activity_at")
+    op.drop_column("patients", "verified_at")
+    op.drop_column("patients", "middle_name")
@@ -0,0 +1,34 @@
+"""Separate columns in the patient search index with a control character
+
+Revision ID: d3f5a7c9e182
+Revises: c7a2d9e4f361
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+
+revision = "d3f5a7c9e182"
+down_revision = "c7a2d9e4f361"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A space separator let a search term match across two columns; the unit
+    # separator (U+001F) is stripped from search terms, so it never matches.
+    op.execute("DROP INDEX IF EXISTS ix_patient_search_trgm")
+    op.execute(
+        "CREATE INDEX ix_patient_search_trgm ON patients USING gin ("
+        "(first_name || E'\\x1f' || last_name || E'\\x1f' || coalesce(phone, '') || E'\\x1f' || "
+        "coalesce(email, '') || E'\\x1f' || coalesce(abha_number, '')) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_patient_search_trgm")
+    op.execute(
+        "CREATE INDEX ix_patient_search_trgm ON patients USING gin ("
+        "(first_name || ' ' || last_name || ' ' || coalesce(phone, '') || ' ' || "
+        "coalesce(email, '') || ' ' || coalesce(abha_number, '')) gin_trgm_ops)"
+    )
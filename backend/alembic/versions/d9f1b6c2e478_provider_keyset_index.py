@@ -0,0 +1,28 @@
+"""Keyset pagination index for active providers
+
+Revision ID: d9f1b6c2e478
+Revises: c3e8a5d1f607
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d9f1b6c2e478"
+down_revision = "c3e8a5d1f607"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_providers_created_at_id",
+        "providers",
+        ["created_at", "id"],
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_providers_created_at_id", table_name="providers")
@@ -0,0 +1,53 @@
+"""Denormalized active consent types on patients
+
+Revision ID: e4a7c9d2b15f
+Revises: d9f1b6c2e478
+Create Date: 2026-10-15 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "e4a7c9d2b15f"
+down_revision = "d9f1b6c2e478"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "patients",
+        sa.Column(
+            "active_consent_types",
+            postgresql.ARRAY(sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::text[]"),
+        ),
+    )
+    op.execute(
+        """
+        UPDATE patients
+        SET active_consent_types = COALESCE(
+            (
+                SELECT array_agg(DISTINCT consents.consent_type)
+                FROM consents
+                WHERE consents.patient_id = patients.id
+                  AND consents.revoked_at IS NULL
+            ),
+            '{}'::text[]
+        )
+        """
+    )
+    op.create_index(
+        "ix_patients_active_consent_types",
+        "patients",
+        ["active_consent_types"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_patients_active_consent_types", table_name="patients")
+    op.drop_column("patients", "active_consent_types")
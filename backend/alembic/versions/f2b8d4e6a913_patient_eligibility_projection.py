@@ -0,0 +1,73 @@
+"""Patient eligibility projection table
+
+Revision ID: f2b8d4e6a913
+Revises: e4a7c9d2b15f
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "f2b8d4e6a913"
+down_revision = "e4a7c9d2b15f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "patient_eligibility",
+        sa.Column(
+            "patient_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("patients.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("is_verified", sa.Boolean(), nullable=False),
+        sa.Column("date_of_birth", sa.Date(), nullable=False),
+        sa.Column("has_emergency_contact", sa.Boolean(), nullable=False),
+        sa.Column(
+            "consent_expiry",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    # Project existing patients; the latest unrevoked consent per type wins
+    op.execute(
+        """
+        INSERT INTO patient_eligibility (
+            patient_id, is_active, is_verified, date_of_birth,
+            has_emergency_contact, consent_expiry
+        )
+        SELECT
+            patients.id,
+            patients.is_active,
+            patients.is_verified,
+            patients.date_of_birth,
+            patients.emergency_contact IS NOT NULL,
+            COALESCE(
+                (
+                    SELECT jsonb_object_agg(latest.consent_type, latest.expires_at)
+                    FROM (
+                        SELECT DISTINCT ON (consents.consent_type)
+                            consents.consent_type, consents.expires_at
+                        FROM consents
+                        WHERE consents.patient_id = patients.id
+                          AND consents.revoked_at IS NULL
+                        ORDER BY consents.consent_type, consents.granted_at DESC
+                    ) AS latest
+                ),
+                '{}'::jsonb
+            )
+        FROM patients
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("patient_eligibility")
@@ -1,11 +1,13 @@
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, NoReturn, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, insert, update, func, and_, bindparam, tuple_
+from sqlalchemy.exc import IntegrityError
 
+from app.core.cache import get_cached, set_cached, invalidate_cached
 from app.core.database import get_db
 from app.models import Appointment, Patient, Provider
 from app.schemas.appointment import (
@@ -15,50 +17,59 @@ from app.schemas.appointment import (
     AppointmentSlot,
 )
 from app.api.auth import get_current_user
-from app.services.notification import NotificationService
+from app.api.pagination import decode_cursor, set_next_cursor
+from app.services.notification import notification_service
 from app.core.config import settings
 
 router = APIRouter()
 
+# Unique partial index on (provider_id, scheduled_at) for non-cancelled rows;
+# booking conflicts surface as violations of this index.
+APPOINTMENT_SLOT_INDEX = "ix_appt_provider_slot"
+
+_SELECT_BY_ID = select(Appointment).where(Appointment.id == bindparam("appointment_id"))
+
+
+async def _handle_slot_conflict(db: AsyncSession, e: IntegrityError) -> NoReturn:
+    await db.rollback()
+    if APPOINTMENT_SLOT_INDEX in str(e.orig):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Time slot already booked",
+        )
+    raise e
+
 
 @router.post("/", response_model=AppointmentResponse)
 async def create_appointment(
     appointment_data: AppointmentCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ) -> AppointmentResponse:
-    conflicts = await db.execute(
-        select(Appointment).where(
-            and_(
-                Appointment.provider_id == appointment_data.provider_id,
-                Appointment.scheduled_at == appointment_data.scheduled_at,
-                Appointment.status != "cancelled",
-            )
-        )
+    patient_phone = (
+        select(Patient.phone)
+        .where(Patient.id == appointment_data.patient_id)
+        .scalar_subquery()
     )
-    if conflicts.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Time slot already booked",
+    try:
+        result = await db.execute(
+            insert(Appointment)
+            .values(**appointment_data.model_dump())
+            .returning(Appointment, patient_phone)
         )
-    
-    appointment = Appointment(**appointment_data.model_dump())
+    except IntegrityError as e:
+        await _handle_slot_conflict(db, e)
+    appointment, phone = result.one()
     
     if appointment.appointment_type == "virtual":
         pass
     
-    db.add(appointment)
     await db.commit()
-    await db.refresh(appointment)
-    
-    notification_service = NotificationService()
-    patient_result = await db.execute(
-        select(Patient).where(Patient.id == appointment.patient_id)
-    )
-    patient = patient_result.scalar_one()
     
-    await notification_service.send_sms(
-        phone=patient.phone,
+    background_tasks.add_task(
+        notification_service.send_sms,
+        phone=phone,
         message=f"Appointment confirmed for {appointment.scheduled_at.strftime('%B %d at %I:%M %p')}",
     )
     
@@ -71,9 +82,11 @@ async def get_appointment(
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ) -> AppointmentResponse:
-    result = await db.execute(
-        select(Appointment).where(Appointment.id == appointment_id)
-    )
+    cached = await get_cached("appointment", appointment_id, AppointmentResponse)
+    if cached is not None:
+        return cached
+    
+    result = await db.execute(_SELECT_BY_ID, {"appointment_id": appointment_id})
     appointment = result.scalar_one_or_none()
     
     if not appointment:
@@ -82,7 +95,10 @@ async def get_appointment(
             detail="Appointment not found",
         )
     
-    return AppointmentResponse.model_validate(appointment)
+    response = AppointmentResponse.model_validate(appointment)
+    await set_cached("appointment", appointment_id, response)
+    
+    return response
 
 
 @router.put("/{appointment_id}", response_model=AppointmentResponse)
@@ -92,9 +108,20 @@ async def update_appointment(
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ) -> AppointmentResponse:
-    result = await db.execute(
-        select(Appointment).where(Appointment.id == appointment_id)
-    )
+    update_data = appointment_data.model_dump(exclude_unset=True)
+    
+    if "status" in update_data and update_data["status"] == "cancelled":
+        update_data["cancelled_at"] = datetime.utcnow()
+    
+    try:
+        result = await db.execute(
+            update(Appointment)
+            .where(Appointment.id == appointment_id)
+            .values(**update_data, updated_at=func.now())
+            .returning(Appointment)
+        )
+    except IntegrityError as e:
+        await _handle_slot_conflict(db, e)
     appointment = result.scalar_one_or_none()
     
     if not appointment:
@@ -103,22 +130,15 @@ async def update_appointment(
             detail="Appointment not found",
         )
     
-    update_data = appointment_data.model_dump(exclude_unset=True)
-    
-    if "status" in update_data and update_data["status"] == "cancelled":
-        appointment.cancelled_at = datetime.utcnow()
-    
-    for field, value in update_data.items():
-        setattr(appointment, field, value)
-    
     await db.commit()
-    await db.refresh(appointment)
+    await invalidate_cached("appointment", appointment_id)
     
     return AppointmentResponse.model_validate(appointment)
 
 
 @router.get("/", response_model=List[AppointmentResponse])
 async def list_appointments(
+    response: Response,
     patient_id: Optional[UUID] = Query(None),
     provider_id: Optional[UUID] = Query(None),
     status: Optional[str] = Query(None),
@@ -126,10 +146,13 @@ async def list_appointments(
     date_to: Optional[datetime] = Query(None),
     limit: int = Query(10, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ) -> List[AppointmentResponse]:
-    query = select(Appointment)
+    # Plain column rows: responses are built without re-validating
+    # data the database already typed.
+    query = select(*Appointment.__table__.columns)
     
     if patient_id:
         query = query.where(Appointment.patient_id == patient_id)
@@ -146,11 +169,18 @@ async def list_appointments(
     if date_to:
         query = query.where(Appointment.scheduled_at <= date_to)
     
-    query = query.order_by(Appointment.scheduled_at).limit(limit).offset(offset)
+    if cursor:
+        query = query.where(
+            tuple_(Appointment.scheduled_at, Appointment.id) > decode_cursor(cursor)
+        )
+    
+    query = query.order_by(Appointment.scheduled_at, Appointment.id).limit(limit).offset(offset)
     result = await db.execute(query)
-    appointments = result.scalars().all()
+    appointments = [AppointmentResponse.model_construct(**row._mapping) for row in result]
     
-    return [AppointmentResponse.model_validate(a) for a in appointments]
+    set_next_cursor(response, appointments, limit, "scheduled_at")
+    
+    return appointments
 
 
 @router.get("/slots/available", response_model=List[AppointmentSlot])
@@ -164,7 +194,7 @@ async def get_available_slots(
     end_date = start_date + timedelta(days=1)
     
     booked_result = await db.execute(
-        select(Appointment).where(
+        select(Appointment.scheduled_at).where(
             and_(
                 Appointment.provider_id == provider_id,
                 Appointment.scheduled_at >= start_date,
@@ -173,26 +203,27 @@ async def get_available_slots(
             )
         )
     )
-    booked_appointments = booked_result.scalars().all()
-    booked_times = {a.scheduled_at for a in booked_appointments}
-    
-    slots = []
-    current_time = start_date.replace(hour=9, minute=0)
-    end_time = start_date.replace(hour=17, minute=0)
-    
-    while current_time < end_time:
-        if current_time not in booked_times and current_time > datetime.utcnow():
-            slots.append(
-                AppointmentSlot(
-                    provider_id=provider_id,
-                    date=date,
-                    start_time=current_time,
-                    end_time=current_time + timedelta(minutes=settings.APPOINTMENT_SLOT_DURATION_MINUTES),
-                    duration_minutes=settings.APPOINTMENT_SLOT_DURATION_MINUTES,
-                    available=True,
-                    appointment_type=appointment_type,
-                )
-            )
-        current_time += timedelta(minutes=settings.APPOINTMENT_SLOT_DURATION_MINUTES + settings.APPOINTMENT_BUFFER_MINUTES)
-    
-    return slots
\ No newline at end of file
+    booked_times = set(booked_result.scalars().all())
+    
+    slot_duration = timedelta(minutes=settings.APPOINTMENT_SLOT_DURATION_MINUTES)
+    slot_step = slot_duration + timedelta(minutes=settings.APPOINTMENT_BUFFER_MINUTES)
+    day_start = start_date.replace(hour=9, minute=0)
+    day_end = start_date.replace(hour=17, minute=0)
+    slot_count = -((day_start - day_end) // slot_step)
+    now = datetime.utcnow()
+    
+    slot_starts = (day_start + i * slot_step for i in range(slot_count))
+    
+    return [
+        AppointmentSlot(
+            provider_id=provider_id,
+            date=date,
+            start_time=start_time,
+            end_time=start_time + slot_duration,
+            duration_minutes=settings.APPOINTMENT_SLOT_DURATION_MINUTES,
+            available=True,
+            appointment_type=appointment_type,
+        )
+        for start_time in slot_starts
+        if start_time > now and start_time not in booked_times
+    ]
\ No newline at end of file
@@ -1,18 +1,18 @@
 from datetime import datetime, timedelta
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, exists, bindparam
 
 from app.core.database import get_db
 from app.core.security import (
     create_access_token,
     create_refresh_token,
-    verify_password,
-    get_password_hash,
+    averify_password,
     verify_token,
+    verify_token_cached,
     generate_otp,
     hash_otp,
     verify_otp as verify_otp_hash,
@@ -26,12 +26,16 @@ from app.schemas.auth import (
     OTPVerify,
     RefreshTokenRequest,
 )
-from app.services.notification import NotificationService
+from app.services.notification import notification_service
 from app.core.config import settings
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+_SELECT_PROVIDER_BY_EMAIL = select(Provider).where(Provider.email == bindparam("email"))
+_SELECT_PATIENT_BY_PHONE = select(Patient).where(Patient.phone == bindparam("phone"))
+_PATIENT_PHONE_EXISTS = select(exists().where(Patient.phone == bindparam("phone")))
+
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
@@ -43,7 +47,7 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    user_id = verify_token(token)
+    user_id = verify_token_cached(token)
     if user_id is None:
         raise credentials_exception
     
@@ -56,11 +60,11 @@ async def login(
     db: AsyncSession = Depends(get_db),
 ) -> Token:
     result = await db.execute(
-        select(Provider).where(Provider.email == form_data.username)
+        _SELECT_PROVIDER_BY_EMAIL, {"email": form_data.username}
     )
     provider = result.scalar_one_or_none()
     
-    if not provider or not verify_password(form_data.password, provider.hashed_password):
+    if not provider or not await averify_password(form_data.password, provider.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -89,14 +93,14 @@ async def login(
 @router.post("/otp/request")
 async def request_otp(
     request: OTPRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ) -> dict:
-    result = await db.execute(
-        select(Patient).where(Patient.phone == request.phone)
+    registered = await db.execute(
+        _PATIENT_PHONE_EXISTS, {"phone": request.phone}
     )
-    patient = result.scalar_one_or_none()
     
-    if not patient:
+    if not registered.scalar():
         patient = Patient(
             phone=request.phone,
             first_name="Guest",
@@ -109,8 +113,8 @@ async def request_otp(
     otp = generate_otp()
     otp_hash = hash_otp(otp, request.phone)
     
-    notification_service = NotificationService()
-    await notification_service.send_sms(
+    background_tasks.add_task(
+        notification_service.send_sms,
         phone=request.phone,
         message=f"Your Baymax verification code is: {otp}. Valid for {settings.OTP_EXPIRY_MINUTES} minutes.",
     )
@@ -127,7 +131,7 @@ async def verify_otp(
     db: AsyncSession = Depends(get_db),
 ) -> Token:
     result = await db.execute(
-        select(Patient).where(Patient.phone == request.phone)
+        _SELECT_PATIENT_BY_PHONE, {"phone": request.phone}
     )
     patient = result.scalar_one_or_none()
     
@@ -1,18 +1,24 @@
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func, bindparam, tuple_
+from sqlalchemy.orm import raiseload
 
+from app.core.cache import get_cached, set_cached, invalidate_cached
 from app.core.database import get_db
 from app.models import Encounter
 from app.schemas.encounter import EncounterCreate, EncounterUpdate, EncounterResponse
 from app.api.auth import get_current_user
+from app.api.pagination import decode_cursor, set_next_cursor
 from app.services.audit import AuditService
 
 router = APIRouter()
 
+_SELECT_BY_ID = select(Encounter).where(Encounter.id == bindparam("encounter_id"))
+
 
 @router.post("/", response_model=EncounterResponse)
 async def create_encounter(
@@ -46,27 +52,31 @@ async def get_encounter(
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ) -> EncounterResponse:
-    result = await db.execute(
-        select(Encounter).where(Encounter.id == encounter_id)
-    )
-    encounter = result.scalar_one_or_none()
-    
-    if not encounter:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Encounter not found",
-        )
+    response = await get_cached("encounter", encounter_id, EncounterResponse)
+    
+    if response is None:
+        result = await db.execute(_SELECT_BY_ID, {"encounter_id": encounter_id})
+        encounter = result.scalar_one_or_none()
+        
+        if not encounter:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Encounter not found",
+            )
+        
+        response = EncounterResponse.model_validate(encounter)
+        await set_cached("encounter", encounter_id, response)
     
     audit_service = AuditService(db)
     await audit_service.log_phi_access(
         actor_id=current_user["user_id"],
         actor_type="provider",
-        patient_id=encounter.patient_id,
+        patient_id=response.patient_id,
         action="read_encounter",
         ip_address="127.0.0.1",
     )
     
-    return EncounterResponse.model_validate(encounter)
+    return response
 
 
 @router.put("/{encounter_id}", response_model=EncounterResponse)
@@ -76,8 +86,16 @@ async def update_encounter(
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ) -> EncounterResponse:
+    update_data = encounter_data.model_dump(exclude_unset=True)
+    
+    if "status" in update_data and update_data["status"] == "signed":
+        update_data["signed_at"] = datetime.utcnow()
+    
     result = await db.execute(
-        select(Encounter).where(Encounter.id == encounter_id)
+        update(Encounter)
+        .where(Encounter.id == encounter_id)
+        .values(**update_data, version=Encounter.version + 1, updated_at=func.now())
+        .returning(Encounter)
     )
     encounter = result.scalar_one_or_none()
     
@@ -87,19 +105,8 @@ async def update_encounter(
             detail="Encounter not found",
         )
     
-    update_data = encounter_data.model_dump(exclude_unset=True)
-    
-    if "status" in update_data and update_data["status"] == "signed":
-        from datetime import datetime
-        encounter.signed_at = datetime.utcnow()
-    
-    encounter.version += 1
-    
-    for field, value in update_data.items():
-        setattr(encounter, field, value)
-    
     await db.commit()
-    await db.refresh(encounter)
+    await invalidate_cached("encounter", encounter_id)
     
     audit_service = AuditService(db)
     await audit_service.log_event(
@@ -118,15 +125,17 @@ async def update_encounter(
 
 @router.get("/", response_model=List[EncounterResponse])
 async def list_encounters(
+    response: Response,
     patient_id: Optional[UUID] = Query(None),
     provider_id: Optional[UUID] = Query(None),
     status: Optional[str] = Query(None),
     limit: int = Query(10, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ) -> List[EncounterResponse]:
-    query = select(Encounter)
+    query = select(Encounter).options(raiseload("*"))
     
     if patient_id:
         query = query.where(Encounter.patient_id == patient_id)
@@ -137,8 +146,19 @@ async def list_encounters(
     if status:
         query = query.where(Encounter.status == status)
     
-    query = query.order_by(Encounter.created_at.desc()).limit(limit).offset(offset)
+    if cursor:
+        query = query.where(
+            tuple_(Encounter.created_at, Encounter.id) < decode_cursor(cursor)
+        )
+    
+    query = (
+        query.order_by(Encounter.created_at.desc(), Encounter.id.desc())
+        .limit(limit)
+        .offset(offset)
+    )
     result = await db.execute(query)
     encounters = result.scalars().all()
     
+    set_next_cursor(response, encounters, limit, "created_at")
+    
     return [EncounterResponse.model_validate(e) for e in encounters]
\ No newline at end of file
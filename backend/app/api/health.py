@@ -1,14 +1,22 @@
-from typing import Dict, Any
+import asyncio
+import time
+from typing import Dict, Any, Optional, Tuple
 
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
-from app.core.database import get_db
+from app.core.cache import redis_client
+from app.core.database import engine, get_db
 from app.core.config import settings
 
 router = APIRouter()
 
+READINESS_CACHE_TTL_SECONDS = 1.0
+READINESS_CHECK_TIMEOUT_SECONDS = 2.0
+
+_last_readiness: Optional[Tuple[float, Dict[str, Any]]] = None
+
 
 @router.get("/health")
 async def health_check() -> Dict[str, Any]:
@@ -29,24 +37,47 @@ async def database_health(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
         return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
 
 
-@router.get("/health/ready")
-async def readiness_check(db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
-    checks = {
-        "database": False,
-        "redis": False,
-        "ai_service": False,
-    }
-    
-    try:
-        result = await db.execute(text("SELECT 1"))
-        result.scalar()
-        checks["database"] = True
-    except Exception:
-        pass
-    
-    all_ready = all(checks.values())
+async def _db_ping() -> bool:
+    # Borrow a pooled connection directly rather than a request session so
+    # probes never open a transaction on the application's behalf.
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    return True
+
+
+async def _redis_ping() -> bool:
+    return bool(await redis_client.ping())
+
+
+async def _ai_ping() -> bool:
+    return bool(settings.OPENAI_API_KEY) or settings.AWS_BEDROCK_ENABLED
+
+
+async def _run_readiness_checks() -> Dict[str, Any]:
+    names = ("database", "redis", "ai_service")
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(ping(), READINESS_CHECK_TIMEOUT_SECONDS)
+            for ping in (_db_ping, _redis_ping, _ai_ping)
+        ),
+        return_exceptions=True,
+    )
+    checks = {name: result is True for name, result in zip(names, results)}
     
     return {
-        "ready": all_ready,
+        "ready": all(checks.values()),
         "checks": checks,
-    }
\ No newline at end of file
+    }
+
+
+@router.get("/health/ready")
+async def readiness_check() -> Dict[str, Any]:
+    global _last_readiness
+    
+    now = time.monotonic()
+    if _last_readiness is not None and now - _last_readiness[0] < READINESS_CACHE_TTL_SECONDS:
+        return _last_readiness[1]
+    
+    readiness = await _run_readiness_checks()
+    _last_readiness = (now, readiness)
+    return readiness
@@ -1,11 +1,17 @@
 from typing import Dict, Any
-import json
+import asyncio
 from uuid import UUID, uuid4
 
+import orjson
+import ormsgpack
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import redis_client
+from app.core.config import settings
 from app.core.database import get_db
+from app.core.security import phi_encryption
 from app.schemas.intake import WebSocketMessage, TextMessage, AIResponse, RedFlagAlert
 from app.services.ai_intake import AIIntakeService
 from app.core.logging import get_logger
@@ -14,30 +20,103 @@ router = APIRouter()
 logger = get_logger(__name__)
 
 
+# Clients may request compact binary frames by offering this subprotocol;
+# everyone else gets JSON text frames.
+MSGPACK_SUBPROTOCOL = "msgpack"
+
+
+async def _send(websocket: WebSocket, data: Any) -> None:
+    if websocket.state.msgpack:
+        await websocket.send_bytes(ormsgpack.packb(data))
+    else:
+        await websocket.send_text(orjson.dumps(data).decode())
+
+
+async def _receive(websocket: WebSocket) -> Any:
+    if websocket.state.msgpack:
+        return ormsgpack.unpackb(await websocket.receive_bytes())
+    return await websocket.receive_json()
+
+
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
+    """Tracks intake WebSockets held by this worker.
+    
+    With ``relay_enabled``, each connection also subscribes to an
+    ``intake:<session_id>`` Redis channel so messages published from any
+    worker reach the socket, wherever it lives. Published payloads are
+    encrypted, since they carry PHI.
+    """
+    
+    def __init__(self, relay_enabled: bool = False):
+        self.relay_enabled = relay_enabled
+        # Keyed by the 16-byte UUID rather than its 36-char string form.
+        self.active_connections: Dict[bytes, WebSocket] = {}
+        self._relays: Dict[bytes, asyncio.Task] = {}
     
-    async def connect(self, websocket: WebSocket, session_id: str):
-        await websocket.accept()
-        self.active_connections[session_id] = websocket
+    @staticmethod
+    def _channel(session_id: UUID) -> str:
+        return f"intake:{session_id}"
     
-    def disconnect(self, session_id: str):
-        if session_id in self.active_connections:
-            del self.active_connections[session_id]
+    async def connect(self, websocket: WebSocket, session_id: UUID):
+        use_msgpack = MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+        await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL if use_msgpack else None)
+        websocket.state.msgpack = use_msgpack
+        key = session_id.bytes
+        self.active_connections[key] = websocket
+        if self.relay_enabled:
+            self._relays[key] = asyncio.create_task(self._relay(session_id, websocket))
     
-    async def send_json(self, session_id: str, data: dict):
-        if session_id in self.active_connections:
-            await self.active_connections[session_id].send_json(data)
+    async def disconnect(self, session_id: UUID):
+        key = session_id.bytes
+        self.active_connections.pop(key, None)
+        relay = self._relays.pop(key, None)
+        if relay is not None:
+            relay.cancel()
+            try:
+                await relay
+            except asyncio.CancelledError:
+                pass
+    
+    async def send_json(self, session_id: UUID, data: dict):
+        websocket = self.active_connections.get(session_id.bytes)
+        if websocket is not None:
+            await _send(websocket, data)
+            return
+        
+        if not self.relay_enabled:
+            logger.warning(f"No connection for intake session {session_id} on this worker")
+            return
+        
+        payload = phi_encryption.encrypt(orjson.dumps(data).decode())
+        try:
+            await redis_client.publish(self._channel(session_id), payload)
+        except RedisError as e:
+            logger.error(f"Failed to publish to intake session {session_id}: {str(e)}")
+    
+    async def _relay(self, session_id: UUID, websocket: WebSocket):
+        pubsub = redis_client.pubsub()
+        try:
+            await pubsub.subscribe(self._channel(session_id))
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                data = orjson.loads(phi_encryption.decrypt(message["data"].decode()))
+                await _send(websocket, data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Intake relay failed for session {session_id}: {str(e)}")
+        finally:
+            await pubsub.aclose()
 
 
-manager = ConnectionManager()
+manager = ConnectionManager(relay_enabled=settings.INTAKE_CROSS_WORKER_RELAY_ENABLED)
 
 
 @router.websocket("/ws/{session_id}")
 async def intake_websocket(
     websocket: WebSocket,
-    session_id: str,
+    session_id: UUID,
     db: AsyncSession = Depends(get_db),
 ):
     await manager.connect(websocket, session_id)
@@ -46,23 +125,24 @@ async def intake_websocket(
         ai_service = AIIntakeService(db)
         
         while True:
-            data = await websocket.receive_json()
+            data = await _receive(websocket)
             message = WebSocketMessage(**data)
             
             if message.type == "text_message":
                 text_msg = TextMessage(**data)
                 
                 response = await ai_service.process_text_input(
-                    session_id=session_id,
+                    session_id=str(session_id),
                     text=text_msg.content,
                     language=text_msg.language,
                 )
                 
-                await websocket.send_json(response.model_dump())
+                # The service hands back plain dicts, ready to send as-is.
+                await _send(websocket, response)
                 
-                if response.get("type") == "red_flag_alert":
+                if response["type"] == "red_flag_alert":
                     await ai_service.escalate_red_flag(
-                        session_id=session_id,
+                        session_id=str(session_id),
                         red_flag=response,
                     )
             
@@ -70,24 +150,25 @@ async def intake_websocket(
                 pass
             
             elif message.type == "end_session":
-                completion = await ai_service.complete_session(session_id)
-                await websocket.send_json({
+                completion = await ai_service.complete_session(str(session_id))
+                await _send(websocket, {
                     "type": "session_complete",
                     "data": completion.model_dump(),
                 })
                 break
     
     except WebSocketDisconnect:
-        manager.disconnect(session_id)
         logger.info(f"WebSocket disconnected for session {session_id}")
     
     except Exception as e:
         logger.error(f"Error in WebSocket session {session_id}: {str(e)}")
-        await websocket.send_json({
+        await _send(websocket, {
             "type": "error",
             "message": "An error occurred during the intake session",
         })
-        manager.disconnect(session_id)
+    
+    finally:
+        await manager.disconnect(session_id)
 
 
 @router.post("/sessions/{appointment_id}/start")
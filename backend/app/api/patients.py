@@ -1,18 +1,43 @@
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
+from sqlalchemy import select, update, exists, func, bindparam, literal_column, tuple_
 
+from app.core.cache import get_cached, set_cached, invalidate_cached
 from app.core.database import get_db
 from app.models import Patient
 from app.schemas.patient import PatientCreate, PatientUpdate, PatientResponse
 from app.api.auth import get_current_user
+from app.api.pagination import decode_cursor, set_next_cursor
 from app.services.audit import AuditService
 
 router = APIRouter()
 
+_SELECT_BY_ID = select(Patient).where(Patient.id == bindparam("patient_id"))
+
+# Unit separator: stripped from search terms, so a match can't span two columns
+_FIELD_SEPARATOR = "\x1f"
+_SEPARATOR = literal_column("E'\\x1f'")
+_EMPTY = literal_column("''")
+
+# Must match the expression of the ix_patient_search_trgm GIN index exactly
+# (including literal separators) for Postgres to use it.
+PATIENT_SEARCH_TEXT = (
+    Patient.first_name + _SEPARATOR + Patient.last_name
+    + _SEPARATOR + func.coalesce(Patient.phone, _EMPTY)
+    + _SEPARATOR + func.coalesce(Patient.email, _EMPTY)
+    + _SEPARATOR + func.coalesce(Patient.abha_number, _EMPTY)
+)
+
+
+def _search_pattern(q: str) -> str:
+    """ILIKE pattern for q, with its own wildcards and the separator neutralized."""
+    term = q.replace(_FIELD_SEPARATOR, "")
+    term = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{term}%"
+
 
 @router.post("/", response_model=PatientResponse)
 async def create_patient(
@@ -21,9 +46,9 @@ async def create_patient(
     current_user: dict = Depends(get_current_user),
 ) -> PatientResponse:
     existing = await db.execute(
-        select(Patient).where(Patient.phone == patient_data.phone)
+        select(exists().where(Patient.phone == patient_data.phone))
     )
-    if existing.scalar_one_or_none():
+    if existing.scalar():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Patient with this phone number already exists",
@@ -54,25 +79,31 @@ async def get_patient(
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ) -> PatientResponse:
-    result = await db.execute(select(Patient).where(Patient.id == patient_id))
-    patient = result.scalar_one_or_none()
+    response = await get_cached("patient", patient_id, PatientResponse)
     
-    if not patient:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Patient not found",
-        )
+    if response is None:
+        result = await db.execute(_SELECT_BY_ID, {"patient_id": patient_id})
+        patient = result.scalar_one_or_none()
+        
+        if not patient:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Patient not found",
+            )
+        
+        response = PatientResponse.model_validate(patient)
+        await set_cached("patient", patient_id, response)
     
     audit_service = AuditService(db)
     await audit_service.log_phi_access(
         actor_id=current_user["user_id"],
         actor_type="provider",
-        patient_id=patient.id,
+        patient_id=response.id,
         action="read",
         ip_address="127.0.0.1",
     )
     
-    return PatientResponse.model_validate(patient)
+    return response
 
 
 @router.put("/{patient_id}", response_model=PatientResponse)
@@ -82,7 +113,14 @@ async def update_patient(
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ) -> PatientResponse:
-    result = await db.execute(select(Patient).where(Patient.id == patient_id))
+    update_data = patient_data.model_dump(exclude_unset=True)
+    
+    result = await db.execute(
+        update(Patient)
+        .where(Patient.id == patient_id)
+        .values(**update_data, updated_at=func.now())
+        .returning(Patient)
+    )
     patient = result.scalar_one_or_none()
     
     if not patient:
@@ -91,12 +129,8 @@ async def update_patient(
             detail="Patient not found",
         )
     
-    update_data = patient_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(patient, field, value)
-    
     await db.commit()
-    await db.refresh(patient)
+    await invalidate_cached("patient", patient_id)
     
     audit_service = AuditService(db)
     await audit_service.log_event(
@@ -114,26 +148,28 @@ async def update_patient(
 
 @router.get("/", response_model=List[PatientResponse])
 async def search_patients(
+    response: Response,
     q: Optional[str] = Query(None, description="Search query"),
     limit: int = Query(10, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ) -> List[PatientResponse]:
-    query = select(Patient)
+    query = select(*Patient.__table__.columns)
     
     if q:
-        search_filter = or_(
-            Patient.first_name.ilike(f"%{q}%"),
-            Patient.last_name.ilike(f"%{q}%"),
-            Patient.phone.ilike(f"%{q}%"),
-            Patient.email.ilike(f"%{q}%"),
-            Patient.abha_number.ilike(f"%{q}%"),
+        query = query.where(PATIENT_SEARCH_TEXT.ilike(_search_pattern(q), escape="\\"))
+    
+    if cursor:
+        query = query.where(
+            tuple_(Patient.created_at, Patient.id) > decode_cursor(cursor)
         )
-        query = query.where(search_filter)
     
-    query = query.limit(limit).offset(offset)
+    query = query.order_by(Patient.created_at, Patient.id).limit(limit).offset(offset)
     result = await db.execute(query)
-    patients = result.scalars().all()
+    patients = [PatientResponse.model_construct(**row._mapping) for row in result]
+    
+    set_next_cursor(response, patients, limit, "created_at")
     
-    return [PatientResponse.model_validate(p) for p in patients]
\ No newline at end of file
+    return patients
\ No newline at end of file
@@ -2,47 +2,86 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func, bindparam, or_, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import raiseload
 
+from app.core.cache import get_or_load, invalidate_cached
 from app.core.database import get_db
-from app.core.security import get_password_hash
+from app.core.security import aget_password_hash
 from app.models import Provider
 from app.schemas.provider import ProviderCreate, ProviderUpdate, ProviderResponse
 from app.api.auth import get_current_user
+from app.api.pagination import decode_cursor, set_next_cursor
 
 router = APIRouter()
 
+_SELECT_BY_ID = select(Provider).where(Provider.id == bindparam("provider_id"))
+
+# One statement shape for every filter combination, so the prepared
+# statement (and its plan) is shared across all listing requests.
+_spec = bindparam("specialization", type_=Provider.specialization.type)
+_avail = bindparam("is_available", type_=Provider.is_available.type)
+_cursor_created_at = bindparam("cursor_created_at", type_=Provider.created_at.type)
+_cursor_id = bindparam("cursor_id", type_=Provider.id.type)
+_LIST_ACTIVE = (
+    select(Provider)
+    .options(raiseload("*"))
+    .where(
+        Provider.is_active == True,
+        or_(_spec.is_(None), Provider.specialization == _spec),
+        or_(_avail.is_(None), Provider.is_available == _avail),
+        or_(
+            _cursor_created_at.is_(None),
+            tuple_(Provider.created_at, Provider.id) < tuple_(_cursor_created_at, _cursor_id),
+        ),
+    )
+    .order_by(Provider.created_at.desc(), Provider.id.desc())
+    .limit(bindparam("limit"))
+    .offset(bindparam("offset"))
+)
+
+_PROVIDER_FIELDS = tuple(ProviderResponse.model_fields)
+
+
+def _to_dict(provider: Provider) -> dict:
+    return {field: getattr(provider, field) for field in _PROVIDER_FIELDS}
+
+
+def _to_response(provider: Provider) -> ProviderResponse:
+    # Rows come from our own table, so skip re-running the schema validators.
+    return ProviderResponse.model_construct(**_to_dict(provider))
+
 
 @router.post("/", response_model=ProviderResponse)
 async def create_provider(
     provider_data: ProviderCreate,
     db: AsyncSession = Depends(get_db),
 ) -> ProviderResponse:
-    existing = await db.execute(
-        select(Provider).where(
-            (Provider.email == provider_data.email) |
-            (Provider.registration_number == provider_data.registration_number)
-        )
+    provider_dict = provider_data.model_dump()
+    hashed_password = await aget_password_hash(provider_dict.pop("password"))
+    
+    # No conflict target: a clash on either the email or the
+    # registration_number unique constraint skips the insert.
+    result = await db.execute(
+        pg_insert(Provider)
+        .values(**provider_dict, hashed_password=hashed_password)
+        .on_conflict_do_nothing()
+        .returning(Provider)
     )
-    if existing.scalar_one_or_none():
+    provider = result.scalar_one_or_none()
+    
+    if not provider:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Provider with this email or registration number already exists",
         )
     
-    provider_dict = provider_data.model_dump()
-    password = provider_dict.pop("password")
-    provider = Provider(
-        **provider_dict,
-        hashed_password=get_password_hash(password)
-    )
-    
-    db.add(provider)
     await db.commit()
-    await db.refresh(provider)
     
-    return ProviderResponse.model_validate(provider)
+    return _to_response(provider)
 
 
 @router.get("/{provider_id}", response_model=ProviderResponse)
@@ -50,16 +89,20 @@ async def get_provider(
     provider_id: UUID,
     db: AsyncSession = Depends(get_db),
 ) -> ProviderResponse:
-    result = await db.execute(select(Provider).where(Provider.id == provider_id))
-    provider = result.scalar_one_or_none()
+    async def load() -> Optional[ProviderResponse]:
+        result = await db.execute(_SELECT_BY_ID, {"provider_id": provider_id})
+        provider = result.scalar_one_or_none()
+        return _to_response(provider) if provider else None
     
-    if not provider:
+    response = await get_or_load("provider", provider_id, ProviderResponse, load)
+    
+    if response is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Provider not found",
         )
     
-    return ProviderResponse.model_validate(provider)
+    return response
 
 
 @router.put("/{provider_id}", response_model=ProviderResponse)
@@ -75,7 +118,14 @@ async def update_provider(
             detail="Can only update your own profile",
         )
     
-    result = await db.execute(select(Provider).where(Provider.id == provider_id))
+    update_data = provider_data.model_dump(exclude_unset=True)
+    
+    result = await db.execute(
+        update(Provider)
+        .where(Provider.id == provider_id)
+        .values(**update_data, updated_at=func.now())
+        .returning(Provider)
+    )
     provider = result.scalar_one_or_none()
     
     if not provider:
@@ -84,34 +134,38 @@ async def update_provider(
             detail="Provider not found",
         )
     
-    update_data = provider_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(provider, field, value)
-    
     await db.commit()
-    await db.refresh(provider)
+    await invalidate_cached("provider", provider_id)
     
-    return ProviderResponse.model_validate(provider)
+    return _to_response(provider)
 
 
-@router.get("/", response_model=List[ProviderResponse])
+@router.get("/", responses={200: {"model": List[ProviderResponse]}})
 async def list_providers(
     specialization: Optional[str] = Query(None),
     is_available: Optional[bool] = Query(None),
     limit: int = Query(10, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
-) -> List[ProviderResponse]:
-    query = select(Provider).where(Provider.is_active == True)
-    
-    if specialization:
-        query = query.where(Provider.specialization == specialization)
-    
-    if is_available is not None:
-        query = query.where(Provider.is_available == is_available)
-    
-    query = query.limit(limit).offset(offset)
-    result = await db.execute(query)
+) -> ORJSONResponse:
+    cursor_created_at, cursor_id = decode_cursor(cursor) if cursor else (None, None)
+    result = await db.execute(
+        _LIST_ACTIVE,
+        {
+            "specialization": specialization or None,
+            "is_available": is_available,
+            "cursor_created_at": cursor_created_at,
+            "cursor_id": cursor_id,
+            "limit": limit,
+            "offset": offset,
+        },
+    )
     providers = result.scalars().all()
     
-    return [ProviderResponse.model_validate(p) for p in providers]
\ No newline at end of file
+    # Trusted rows go straight to orjson, skipping validation and jsonable_encoder;
+    # responses= above documents the schema that response_model would have.
+    response = ORJSONResponse([_to_dict(p) for p in providers])
+    set_next_cursor(response, providers, limit, "created_at")
+    
+    return response
\ No newline at end of file
@@ -0,0 +1,103 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Type, TypeVar
+from uuid import UUID
+
+import redis.asyncio as redis
+from cryptography.fernet import InvalidToken
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.security import phi_encryption
+
+logger = get_logger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+redis_client = redis.from_url(settings.REDIS_URL)
+
+# Per-key single-flight locks for get_or_load; entries are [lock, waiters].
+_load_locks: Dict[str, List] = {}
+
+
+def _cache_key(resource: str, resource_id: UUID) -> str:
+    return f"{resource}:{resource_id}"
+
+
+async def get_cached(
+    resource: str,
+    resource_id: UUID,
+    model: Type[ModelT],
+) -> Optional[ModelT]:
+    try:
+        payload = await redis_client.get(_cache_key(resource, resource_id))
+    except RedisError as e:
+        logger.warning("Cache read failed", resource=resource, error=str(e))
+        return None
+    
+    if payload is None:
+        return None
+    
+    try:
+        return model.model_validate_json(phi_encryption.decrypt(payload.decode()))
+    except (InvalidToken, ValueError):
+        return None
+
+
+async def set_cached(
+    resource: str,
+    resource_id: UUID,
+    value: BaseModel,
+    ttl_seconds: int = settings.CACHE_TTL_SECONDS,
+) -> None:
+    payload = phi_encryption.encrypt(value.model_dump_json())
+    try:
+        await redis_client.set(_cache_key(resource, resource_id), payload, ex=ttl_seconds)
+    except RedisError as e:
+        logger.warning("Cache write failed", resource=resource, error=str(e))
+
+
+async def get_or_load(
+    resource: str,
+    resource_id: UUID,
+    model: Type[ModelT],
+    loader: Callable[[], Awaitable[Optional[ModelT]]],
+) -> Optional[ModelT]:
+    """Read through the cache, letting only one coroutine per key hit the loader.
+    
+    Concurrent misses for the same key in this worker wait for the first
+    loader and then re-read the cache instead of all querying the database.
+    """
+    cached = await get_cached(resource, resource_id, model)
+    if cached is not None:
+        return cached
+    
+    key = _cache_key(resource, resource_id)
+    entry = _load_locks.setdefault(key, [asyncio.Lock(), 0])
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            cached = await get_cached(resource, resource_id, model)
+            if cached is not None:
+                return cached
+            
+            value = await loader()
+            if value is not None:
+                await set_cached(resource, resource_id, value)
+            return value
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0:
+            _load_locks.pop(key, None)
+
+
+async def invalidate_cached(resource: str, resource_id: UUID) -> None:
+    try:
+        await redis_client.delete(_cache_key(resource, resource_id))
+    except RedisError as e:
+        logger.warning("Cache invalidation failed", resource=resource, error=str(e))
+
+
+async def close_cache() -> None:
+    await redis_client.aclose()
@@ -1,4 +1,5 @@
-from typing import Any, List, Optional, Union
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple, Union
 from pydantic import AnyHttpUrl, PostgresDsn, field_validator, ValidationInfo
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import secrets
@@ -59,7 +60,13 @@ class Settings(BaseSettings):
             path=values.get("POSTGRES_DB"),
         ).unicode_string()
     
+    DB_POOL_SIZE: int = 20
+    DB_POOL_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_STATEMENT_CACHE_SIZE: int = 512
+    
     REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_TTL_SECONDS: int = 60
     
     AWS_REGION: str = "ap-south-1"
     AWS_ACCESS_KEY_ID: Optional[str] = None
@@ -94,15 +101,21 @@ class Settings(BaseSettings):
     
     PROMETHEUS_ENABLED: bool = True
     
+    # Disable when the reverse proxy already compresses responses
+    GZIP_ENABLED: bool = True
+    GZIP_MINIMUM_SIZE: int = 8192
+    
     MAX_FILE_SIZE_MB: int = 15
     MAX_FILES_PER_UPLOAD: int = 10
-    ALLOWED_FILE_EXTENSIONS: List[str] = [".jpg", ".jpeg", ".png", ".pdf"]
+    ALLOWED_FILE_EXTENSIONS: Tuple[str, ...] = (".jpg", ".jpeg", ".png", ".pdf")
     
     INTAKE_MAX_TURNS: int = 50
     INTAKE_TIMEOUT_MINUTES: int = 30
+    # Relay intake messages published by other workers over Redis pub/sub
+    INTAKE_CROSS_WORKER_RELAY_ENABLED: bool = False
     
     RED_FLAG_ESCALATION_ENABLED: bool = True
-    RED_FLAG_NOTIFICATION_CHANNELS: List[str] = ["sms", "email", "system"]
+    RED_FLAG_NOTIFICATION_CHANNELS: Tuple[str, ...] = ("sms", "email", "system")
     
     ENCRYPTION_KEY: Optional[str] = None
     
@@ -119,9 +132,9 @@ class Settings(BaseSettings):
     RATE_LIMIT_PERIOD: int = 60
     
     LANGUAGE_DETECTION_ENABLED: bool = True
-    SUPPORTED_LANGUAGES: List[str] = ["en", "hi", "te", "ta", "bn", "mr", "gu", "kn", "ml", "pa", "ur"]
+    SUPPORTED_LANGUAGES: Tuple[str, ...] = ("en", "hi", "te", "ta", "bn", "mr", "gu", "kn", "ml", "pa", "ur")
     
-    SPECIALTIES_ENABLED: List[str] = ["orthopedics"]
+    SPECIALTIES_ENABLED: Tuple[str, ...] = ("orthopedics",)
     
     TELEMEDICINE_BANNER_TEXT: str = "AI does not diagnose; an RMP will review and advise"
     
@@ -148,4 +161,9 @@ class Settings(BaseSettings):
     WEBSOCKET_CONNECTION_TIMEOUT: int = 60
 
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
+
+
+settings = get_settings()
\ No newline at end of file
@@ -10,8 +10,15 @@ engine = create_async_engine(
     echo=settings.DEBUG,
     future=True,
     pool_pre_ping=True,
-    pool_size=20,
-    max_overflow=40,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    query_cache_size=1200,
+    connect_args={
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        # Short OLTP queries never benefit from JIT compilation.
+        "server_settings": {"jit": "off"},
+    },
 )
 
 AsyncSessionLocal = async_sessionmaker(
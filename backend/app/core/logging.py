@@ -2,12 +2,17 @@ import logging
 import sys
 from typing import Any
 
+import orjson
 import structlog
 from structlog.stdlib import LoggerFactory
 
 from app.core.config import settings
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    return orjson.dumps(obj, **kwargs).decode()
+
+
 def setup_logging() -> None:
     log_level = logging.DEBUG if settings.DEBUG else logging.INFO
     
@@ -17,26 +22,34 @@ def setup_logging() -> None:
         level=log_level,
     )
     
-    structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
+    processors = [
+        structlog.stdlib.filter_by_level,
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.PositionalArgumentsFormatter(),
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        structlog.processors.UnicodeDecoder(),
+    ]
+    
+    if settings.DEBUG:
+        # Walks the stack on every call; only worth it while developing.
+        processors.append(
             structlog.processors.CallsiteParameterAdder(
                 parameters=[
                     structlog.processors.CallsiteParameter.FILENAME,
                     structlog.processors.CallsiteParameter.FUNC_NAME,
                     structlog.processors.CallsiteParameter.LINENO,
                 ]
-            ),
-            structlog.processors.dict_tracebacks,
-            structlog.dev.ConsoleRenderer() if settings.DEBUG else structlog.processors.JSONRenderer(),
-        ],
+            )
+        )
+        processors.append(structlog.dev.ConsoleRenderer())
+    else:
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
+    
+    structlog.configure(
+        processors=processors,
         context_class=dict,
         logger_factory=LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -1,16 +1,33 @@
-from datetime import datetime, timedelta
-from typing import Optional, Any, Union
+from collections import OrderedDict
+from datetime import timedelta
+from typing import List, Optional, Any, Union
+import asyncio
+import base64
+import os
 import secrets
 import hashlib
 import hmac
+import time
 
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from cryptography.fernet import Fernet
+import bcrypt
+from jose import JWTError, jwk, jwt
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+BCRYPT_ROUNDS = 12
+# bcrypt only looks at the first 72 bytes; passlib truncated silently and
+# newer bcrypt releases reject longer input, so truncate explicitly to keep
+# existing hashes verifiable.
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# Built once: given a plain string, jose re-parses it as a possible JWK set
+# and constructs a new HMAC key on every encode and decode.
+_jwt_key = jwk.construct(settings.SECRET_KEY, settings.ALGORITHM)
 
 
 def create_access_token(
@@ -19,17 +36,17 @@ def create_access_token(
     scopes: list = [],
 ) -> str:
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        lifetime = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
     
     to_encode = {
-        "exp": expire,
+        "exp": int(time.time()) + lifetime,
         "sub": str(subject),
         "scopes": scopes,
         "type": "access",
     }
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _jwt_key, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
@@ -38,47 +55,121 @@ def create_refresh_token(
     expires_delta: Optional[timedelta] = None,
 ) -> str:
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        lifetime = settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
     
     to_encode = {
-        "exp": expire,
+        "exp": int(time.time()) + lifetime,
         "sub": str(subject),
         "type": "refresh",
     }
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _jwt_key, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
-def verify_token(token: str, token_type: str = "access") -> Optional[str]:
+def _decode_token(token: str, token_type: str) -> Optional[dict]:
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        if payload.get("type") != token_type:
-            return None
-        subject: str = payload.get("sub")
-        if subject is None:
-            return None
-        return subject
+        payload = jwt.decode(token, _jwt_key, algorithms=[settings.ALGORITHM])
     except JWTError:
         return None
+    if payload.get("type") != token_type or payload.get("sub") is None:
+        return None
+    return payload
+
+
+def verify_token(token: str, token_type: str = "access") -> Optional[str]:
+    payload = _decode_token(token, token_type)
+    if payload is None:
+        return None
+    return payload["sub"]
+
+
+# Verified tokens are memoized by a digest of the token (never the raw token)
+# so repeat requests with the same bearer token skip signature verification.
+TOKEN_CACHE_MAXSIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 60
+TOKEN_CACHE_NEGATIVE_TTL_SECONDS = 5
+TOKEN_CACHE_MIN_REMAINING_SECONDS = 5
+
+_token_cache: "OrderedDict[bytes, tuple[Optional[str], float]]" = OrderedDict()
+
+
+def _token_cache_key(token: str, token_type: str) -> bytes:
+    return hashlib.blake2b(f"{token_type}:{token}".encode(), digest_size=16).digest()
+
+
+def _token_cache_put(key: bytes, subject: Optional[str], cached_until: float) -> None:
+    _token_cache[key] = (subject, cached_until)
+    _token_cache.move_to_end(key)
+    if len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+        _token_cache.popitem(last=False)
+
+
+def verify_token_cached(token: str, token_type: str = "access") -> Optional[str]:
+    key = _token_cache_key(token, token_type)
+    now = time.time()
+    
+    entry = _token_cache.get(key)
+    if entry is not None:
+        subject, cached_until = entry
+        if now < cached_until:
+            _token_cache.move_to_end(key)
+            return subject
+        del _token_cache[key]
+    
+    payload = _decode_token(token, token_type)
+    if payload is None:
+        _token_cache_put(key, None, now + TOKEN_CACHE_NEGATIVE_TTL_SECONDS)
+        return None
+    
+    expires_at = float(payload.get("exp", now))
+    if expires_at - now > TOKEN_CACHE_MIN_REMAINING_SECONDS:
+        ttl = min(TOKEN_CACHE_TTL_SECONDS, settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+        _token_cache_put(key, payload["sub"], min(now + ttl, expires_at))
+    
+    return payload["sub"]
+
+
+def clear_token_cache() -> None:
+    _token_cache.clear()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(
+        plain_password.encode()[:BCRYPT_MAX_PASSWORD_BYTES], hashed_password.encode()
+    )
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        password.encode()[:BCRYPT_MAX_PASSWORD_BYTES], bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    ).decode()
+
+
+# bcrypt releases the GIL while hashing, so running it in the default
+# thread pool keeps the event loop free during login and registration.
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    return await asyncio.to_thread(get_password_hash, password)
+
+
+_OTP_MODULUS = 10 ** settings.OTP_LENGTH
+_OTP_FORMAT = f"{{:0{settings.OTP_LENGTH}d}}"
+_OTP_SECRET = settings.SECRET_KEY.encode()
 
 
 def generate_otp() -> str:
-    return "".join([str(secrets.randbelow(10)) for _ in range(settings.OTP_LENGTH)])
+    return _OTP_FORMAT.format(secrets.randbelow(_OTP_MODULUS))
 
 
 def hash_otp(otp: str, phone: str) -> str:
-    key = f"{settings.SECRET_KEY}{phone}"
-    return hashlib.sha256(f"{otp}{key}".encode()).hexdigest()
+    # Same byte layout as before (otp, secret, phone) so outstanding OTP
+    # hashes remain verifiable.
+    return hashlib.sha256(otp.encode() + _OTP_SECRET + phone.encode()).hexdigest()
 
 
 def verify_otp(otp: str, phone: str, hashed_otp: str) -> bool:
@@ -89,19 +180,54 @@ def generate_secure_token() -> str:
     return secrets.token_urlsafe(32)
 
 
+PHI_AEAD_VERSION = 0x01
+PHI_AEAD_NONCE_BYTES = 12
+_FERNET_VERSION = 0x80
+
+
 class PHIEncryption:
+    """AES-256-GCM encryption for PHI at rest.
+    
+    Ciphertexts are ``urlsafe_b64(version || nonce || ciphertext+tag)``. Tokens
+    written by the previous Fernet scheme are recognised by their version
+    byte and still decrypt.
+    """
+    
     def __init__(self):
         if settings.ENCRYPTION_KEY:
-            self.cipher = Fernet(settings.ENCRYPTION_KEY.encode())
+            fernet_key = settings.ENCRYPTION_KEY.encode()
         else:
-            key = Fernet.generate_key()
-            self.cipher = Fernet(key)
+            fernet_key = Fernet.generate_key()
+        self.cipher = Fernet(fernet_key)
+        aead_key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"baymax-phi-aes-gcm",
+        ).derive(fernet_key)
+        self._aead = AESGCM(aead_key)
     
     def encrypt(self, data: str) -> str:
-        return self.cipher.encrypt(data.encode()).decode()
+        nonce = os.urandom(PHI_AEAD_NONCE_BYTES)
+        sealed = self._aead.encrypt(nonce, data.encode(), None)
+        return base64.urlsafe_b64encode(bytes((PHI_AEAD_VERSION,)) + nonce + sealed).decode()
+    
+    def encrypt_many(self, items: List[str]) -> List[str]:
+        encrypt = self.encrypt
+        return [encrypt(item) for item in items]
     
     def decrypt(self, encrypted_data: str) -> str:
-        return self.cipher.decrypt(encrypted_data.encode()).decode()
+        raw = base64.urlsafe_b64decode(encrypted_data.encode())
+        if raw[:1] == bytes((_FERNET_VERSION,)):
+            return self.cipher.decrypt(encrypted_data.encode()).decode()
+        if raw[:1] != bytes((PHI_AEAD_VERSION,)):
+            raise InvalidToken
+        nonce = raw[1:1 + PHI_AEAD_NONCE_BYTES]
+        try:
+            plaintext = self._aead.decrypt(nonce, raw[1 + PHI_AEAD_NONCE_BYTES:], None)
+        except InvalidTag:
+            raise InvalidToken
+        return plaintext.decode()
 
 
 phi_encryption = PHIEncryption()
\ No newline at end of file
@@ -1,8 +1,9 @@
 """Value objects for Intake domain."""
-from dataclasses import dataclass
-from datetime import datetime
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 
 class IntakeStatus(Enum):
@@ -36,7 +37,17 @@ class SafetyCheckResult(Enum):
     WARNING = "warning"
 
 
-@dataclass(frozen=True)
+_EPOCH = datetime(1970, 1, 1)
+
+HIGH_ENERGY_MECHANISMS = ("fall from height", "mvc", "high energy", "crush")
+
+# One case-insensitive alternation scans the text once for every keyword.
+_HIGH_ENERGY_MECHANISM_RE = re.compile(
+    "|".join(map(re.escape, HIGH_ENERGY_MECHANISMS)), re.IGNORECASE
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Language:
     """Language value object."""
     
@@ -65,7 +76,7 @@ class Language:
             raise ValueError(f"Invalid confidence: {self.confidence}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChiefComplaint:
     """Chief complaint value object."""
     
@@ -81,7 +92,7 @@ class ChiefComplaint:
             raise ValueError("Severity must be between 1 and 10")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Symptom:
     """Individual symptom value object."""
     
@@ -89,8 +100,8 @@ class Symptom:
     duration: Optional[str] = None
     severity: Optional[int] = None  # 1-10 scale
     frequency: Optional[str] = None
-    aggravating_factors: List[str] = None
-    relieving_factors: List[str] = None
+    aggravating_factors: Tuple[str, ...] = field(default_factory=tuple)
+    relieving_factors: Tuple[str, ...] = field(default_factory=tuple)
     
     def __post_init__(self):
         if not self.name:
@@ -99,7 +110,7 @@ class Symptom:
             raise ValueError("Severity must be between 1 and 10")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VitalSigns:
     """Vital signs value object."""
     
@@ -146,27 +157,57 @@ class VitalSigns:
         return None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RedFlag:
     """Red flag indicator value object."""
     
     condition: str
     severity: RedFlagSeverity
-    detected_at: datetime
+    # Epoch nanoseconds, e.g. time.time_ns(); the datetime is built on read
+    detected_at_ns: int
     context: str
     confidence: float = 1.0
     escalation_required: bool = False
     
     def __post_init__(self):
+        if not isinstance(self.detected_at_ns, int):
+            raise TypeError("detected_at_ns must be epoch nanoseconds; use RedFlag.from_datetime")
+        
         if not 0 <= self.confidence <= 1:
             raise ValueError(f"Invalid confidence: {self.confidence}")
         
         # Critical red flags always require escalation
         if self.severity == RedFlagSeverity.CRITICAL:
             object.__setattr__(self, 'escalation_required', True)
+    
+    @classmethod
+    def from_datetime(
+        cls,
+        *,
+        condition: str,
+        severity: RedFlagSeverity,
+        detected_at: datetime,
+        context: str,
+        confidence: float = 1.0,
+        escalation_required: bool = False
+    ) -> 'RedFlag':
+        """Create a red flag from a naive UTC detection time."""
+        return cls(
+            condition=condition,
+            severity=severity,
+            detected_at_ns=(detected_at - _EPOCH) // timedelta(microseconds=1) * 1000,
+            context=context,
+            confidence=confidence,
+            escalation_required=escalation_required
+        )
+    
+    @property
+    def detected_at(self) -> datetime:
+        """Detection time as a naive UTC datetime, built on demand."""
+        return _EPOCH + timedelta(microseconds=self.detected_at_ns // 1000)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrthopedicAssessment:
     """Orthopedic-specific assessment value object."""
     
@@ -183,19 +224,16 @@ class OrthopedicAssessment:
     
     def is_high_risk(self) -> bool:
         """Check if assessment indicates high risk."""
-        high_risk_indicators = [
-            self.deformity_noted,
-            self.neurovascular_status and "compromised" in self.neurovascular_status.lower(),
-            self.weight_bearing_status is False,
-            self.mechanism_of_injury and any(
-                term in self.mechanism_of_injury.lower()
-                for term in ["fall from height", "mvc", "high energy", "crush"]
-            )
-        ]
-        return any(high_risk_indicators)
+        if self.deformity_noted or self.weight_bearing_status is False:
+            return True
+        if self.neurovascular_status and "compromised" in self.neurovascular_status.lower():
+            return True
+        if self.mechanism_of_injury:
+            return _HIGH_ENERGY_MECHANISM_RE.search(self.mechanism_of_injury) is not None
+        return False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConversationTurn:
     """Single turn in conversation."""
     
@@ -205,7 +243,7 @@ class ConversationTurn:
     ai_response: Dict[str, Any]
     language_detected: Optional[Language] = None
     safety_check: Optional[SafetyCheckResult] = None
-    red_flags_detected: List[RedFlag] = None
+    red_flags_detected: Tuple[RedFlag, ...] = field(default_factory=tuple)
     
     def __post_init__(self):
         if self.turn_id < 0:
@@ -216,7 +254,23 @@ class ConversationTurn:
             raise ValueError("AI response is required")
 
 
-@dataclass(frozen=True)
+# Display names for IntakeCompleteness sections, indexed by flag bit.
+INTAKE_SECTION_NAMES = (
+    "Chief Complaint",
+    "History of Present Illness",
+    "Past Medical History",
+    "Medications",
+    "Allergies",
+    "Social History",
+    "Family History",
+    "Review of Systems",
+)
+
+# Minimum: chief complaint (bit 0), HPI (1), medications (3), allergies (4)
+_REQUIRED_SECTIONS_MASK = 0b0001_1011
+
+
+@dataclass(frozen=True, slots=True)
 class IntakeCompleteness:
     """Measure of intake completeness."""
     
@@ -228,51 +282,36 @@ class IntakeCompleteness:
     social_history_collected: bool = False
     family_history_collected: bool = False
     ros_collected: bool = False
+    flags: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Pack the sections into one int, bit i <-> INTAKE_SECTION_NAMES[i]
+        object.__setattr__(self, 'flags', (
+            bool(self.chief_complaint_collected)
+            | bool(self.hpi_collected) << 1
+            | bool(self.pmh_collected) << 2
+            | bool(self.medications_collected) << 3
+            | bool(self.allergies_collected) << 4
+            | bool(self.social_history_collected) << 5
+            | bool(self.family_history_collected) << 6
+            | bool(self.ros_collected) << 7
+        ))
     
     @property
     def score(self) -> float:
         """Calculate completeness score (0-1)."""
-        fields = [
-            self.chief_complaint_collected,
-            self.hpi_collected,
-            self.pmh_collected,
-            self.medications_collected,
-            self.allergies_collected,
-            self.social_history_collected,
-            self.family_history_collected,
-            self.ros_collected
-        ]
-        return sum(fields) / len(fields)
+        return self.flags.bit_count() / len(INTAKE_SECTION_NAMES)
     
     @property
     def is_complete(self) -> bool:
         """Check if intake meets minimum requirements."""
-        # Minimum: chief complaint, HPI, medications, allergies
-        return all([
-            self.chief_complaint_collected,
-            self.hpi_collected,
-            self.medications_collected,
-            self.allergies_collected
-        ])
+        return self.flags & _REQUIRED_SECTIONS_MASK == _REQUIRED_SECTIONS_MASK
     
     @property
     def missing_sections(self) -> List[str]:
         """Get list of missing sections."""
-        sections = []
-        if not self.chief_complaint_collected:
-            sections.append("Chief Complaint")
-        if not self.hpi_collected:
-            sections.append("History of Present Illness")
-        if not self.pmh_collected:
-            sections.append("Past Medical History")
-        if not self.medications_collected:
-            sections.append("Medications")
-        if not self.allergies_collected:
-            sections.append("Allergies")
-        if not self.social_history_collected:
-            sections.append("Social History")
-        if not self.family_history_collected:
-            sections.append("Family History")
-        if not self.ros_collected:
-            sections.append("Review of Systems")
-        return sections
\ No newline at end of file
+        flags = self.flags
+        return [
+            name for bit, name in enumerate(INTAKE_SECTION_NAMES)
+            if not flags >> bit & 1
+        ]
@@ -1,13 +1,15 @@
 """Patient aggregate root."""
-from datetime import datetime
-from typing import Optional, List, Dict
+from dataclasses import asdict
+from datetime import date, datetime
+from typing import Any, Optional, List, Dict, FrozenSet
 from uuid import UUID
 
+from app.domain.shared import clock
 from app.domain.shared.aggregate_root import AggregateRoot
 from app.domain.patient.entities import (
     Consent, EmergencyContact, MedicalHistory,
     PatientRegisteredEvent, PatientVerifiedEvent,
-    ConsentGrantedEvent, ConsentRevokedEvent
+    ConsentGrantedEvent, ConsentRevokedEvent, ConsentsRevokedEvent
 )
 from app.domain.patient.value_objects import (
     PhoneNumber, EmailAddress, ABHANumber, PatientName,
@@ -15,9 +17,29 @@ from app.domain.patient.value_objects import (
 )
 
 
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _from_iso(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
 class Patient(AggregateRoot):
     """Patient aggregate root - maintains patient invariants."""
     
+    # Versions between snapshots when rehydrating from an event stream
+    SNAPSHOT_INTERVAL = 50
+    
+    __slots__ = (
+        "phone", "name", "date_of_birth", "gender", "email", "abha_number",
+        "address", "language_preference",
+        "consents", "emergency_contacts", "medical_history",
+        "is_verified", "is_active", "registered_at", "verified_at", "last_activity_at",
+        "_active_consent_by_type", "_primary_contact",
+        "_age_as_of", "_age", "_is_minor", "_is_senior",
+    )
+    
     def __init__(
         self,
         id: UUID,
@@ -43,15 +65,21 @@ class Patient(AggregateRoot):
         
         # Entity collections
         self.consents: List[Consent] = []
+        self._active_consent_by_type: Dict[str, Consent] = {}
         self.emergency_contacts: List[EmergencyContact] = []
+        self._primary_contact: Optional[EmergencyContact] = None
         self.medical_history = MedicalHistory()
         
         # Status fields
         self.is_verified = False
         self.is_active = True
-        self.registered_at = datetime.utcnow()
+        now = clock.now()
+        self.registered_at = now
         self.verified_at: Optional[datetime] = None
-        self.last_activity_at = datetime.utcnow()
+        self.last_activity_at = now
+        
+        # Age-derived flags, snapshotted per calendar day
+        self._refresh_age(date.today())
     
     @classmethod
     def register(
@@ -76,9 +104,10 @@ class Patient(AggregateRoot):
         # Raise domain event
         patient.add_domain_event(
             PatientRegisteredEvent(
-                patient_id=id,
-                phone=phone,
-                name=name
+                aggregate_id=id,
+                occurred_at=patient.registered_at,
+                phone_masked=phone.masked,
+                full_name=name.full_name
             )
         )
         
@@ -90,13 +119,14 @@ class Patient(AggregateRoot):
             raise ValueError("Patient already verified")
         
         self.is_verified = True
-        self.verified_at = datetime.utcnow()
+        self.verified_at = clock.now()
         self.increment_version()
         
         # Raise domain event
         self.add_domain_event(
             PatientVerifiedEvent(
-                patient_id=self.id,
+                aggregate_id=self.id,
+                occurred_at=self.verified_at,
                 verification_method=method
             )
         )
@@ -110,26 +140,29 @@ class Patient(AggregateRoot):
     ) -> Consent:
         """Grant consent for data processing."""
         # Check if similar consent already exists and is active
-        for consent in self.consents:
-            if consent.consent_type == consent_type and consent.is_active:
-                raise ValueError(f"Active consent for {consent_type} already exists")
+        now = clock.now()
+        current = self._active_consent_by_type.get(consent_type)
+        if current is not None and current.is_active_at(now):
+            raise ValueError(f"Active consent for {consent_type} already exists")
         
         consent = Consent(
             id=consent_id,
             patient_id=self.id,
             consent_type=consent_type,
             purpose=purpose,
-            granted_at=datetime.utcnow(),
+            granted_at=now,
             expires_at=expires_at
         )
         
         self.consents.append(consent)
+        self._active_consent_by_type[consent_type] = consent
         self.increment_version()
         
         # Raise domain event
         self.add_domain_event(
             ConsentGrantedEvent(
-                patient_id=self.id,
+                aggregate_id=self.id,
+                occurred_at=now,
                 consent_type=consent_type,
                 purpose=purpose
             )
@@ -139,24 +172,49 @@ class Patient(AggregateRoot):
     
     def revoke_consent(self, consent_type: str) -> None:
         """Revoke consent for a specific type."""
-        consent_found = False
-        for consent in self.consents:
-            if consent.consent_type == consent_type and consent.is_active:
-                consent.revoke()
-                consent_found = True
-                self.increment_version()
-                
-                # Raise domain event
-                self.add_domain_event(
-                    ConsentRevokedEvent(
-                        patient_id=self.id,
-                        consent_type=consent_type
-                    )
-                )
-                break
-        
-        if not consent_found:
+        consent = self._active_consent_by_type.get(consent_type)
+        if consent is None or not consent.is_active:
             raise ValueError(f"No active consent found for {consent_type}")
+        
+        consent.revoke()
+        del self._active_consent_by_type[consent_type]
+        self.increment_version()
+        
+        # Raise domain event
+        self.add_domain_event(
+            ConsentRevokedEvent(
+                aggregate_id=self.id,
+                occurred_at=consent.revoked_at,
+                consent_type=consent_type
+            )
+        )
+    
+    def revoke_all_active_consents(self) -> List[str]:
+        """Revoke every active consent as one change; returns the revoked types."""
+        now = clock.now()
+        now_ts = clock.to_timestamp(now)
+        revoked = [
+            consent_type
+            for consent_type, consent in self._active_consent_by_type.items()
+            if consent.is_active_at_ts(now_ts)
+        ]
+        if not revoked:
+            return revoked
+        
+        for consent_type in revoked:
+            self._active_consent_by_type.pop(consent_type).revoke(now)
+        self.increment_version()
+        
+        # Raise domain event
+        self.add_domain_event(
+            ConsentsRevokedEvent(
+                aggregate_id=self.id,
+                occurred_at=now,
+                consent_types=tuple(revoked)
+            )
+        )
+        
+        return revoked
     
     def add_emergency_contact(
         self,
@@ -167,13 +225,6 @@ class Patient(AggregateRoot):
         is_primary: bool = False
     ) -> EmergencyContact:
         """Add an emergency contact."""
-        # Validate invariants
-        if is_primary:
-            # Only one primary contact allowed
-            for contact in self.emergency_contacts:
-                if contact.is_primary:
-                    contact.is_primary = False
-        
         contact = EmergencyContact(
             id=contact_id,
             name=name,
@@ -182,6 +233,12 @@ class Patient(AggregateRoot):
             is_primary=is_primary
         )
         
+        # Only one primary contact allowed
+        if is_primary:
+            if self._primary_contact is not None:
+                self._primary_contact.is_primary = False
+            self._primary_contact = contact
+        
         self.emergency_contacts.append(contact)
         self.increment_version()
         
@@ -201,7 +258,7 @@ class Patient(AggregateRoot):
         if address:
             self.address = address
         
-        self.last_activity_at = datetime.utcnow()
+        self.last_activity_at = clock.now()
         self.increment_version()
     
     def link_abha(self, abha_number: ABHANumber) -> None:
@@ -226,27 +283,147 @@ class Patient(AggregateRoot):
             raise ValueError("Patient already active")
         
         self.is_active = True
-        self.last_activity_at = datetime.utcnow()
+        self.last_activity_at = clock.now()
         self.increment_version()
     
     def has_active_consent(self, consent_type: str) -> bool:
         """Check if patient has active consent for a type."""
-        for consent in self.consents:
-            if consent.consent_type == consent_type and consent.is_active:
-                return True
-        return False
+        consent = self._active_consent_by_type.get(consent_type)
+        return consent is not None and consent.is_active
+    
+    @property
+    def active_consent_types(self) -> FrozenSet[str]:
+        """
+        Consent types with an unrevoked consent.
+        Persisted as a denormalized column; expiry is checked separately.
+        """
+        return frozenset(self._active_consent_by_type)
     
     def get_active_consents(self) -> List[Consent]:
         """Get all active consents."""
-        return [c for c in self.consents if c.is_active]
+        now_ts = clock.to_timestamp(clock.now())
+        return [c for c in self._active_consent_by_type.values() if c.is_active_at_ts(now_ts)]
     
     def get_primary_emergency_contact(self) -> Optional[EmergencyContact]:
         """Get primary emergency contact."""
-        for contact in self.emergency_contacts:
-            if contact.is_primary:
-                return contact
+        if self._primary_contact is not None:
+            return self._primary_contact
         return self.emergency_contacts[0] if self.emergency_contacts else None
     
+    def needs_snapshot(self, snapshot_version: int) -> bool:
+        """Check if enough changes have accrued since the last snapshot."""
+        return self._version - snapshot_version >= self.SNAPSHOT_INTERVAL
+    
+    def to_snapshot(self) -> Dict[str, Any]:
+        """Serialize aggregate state to a JSON-compatible snapshot."""
+        history = self.medical_history
+        return {
+            "id": str(self.id),
+            "version": self._version,
+            "phone": asdict(self.phone),
+            "name": asdict(self.name),
+            "date_of_birth": self.date_of_birth.value.isoformat(),
+            "gender": self.gender.value,
+            "email": self.email.value if self.email else None,
+            "abha_number": self.abha_number.value if self.abha_number else None,
+            "address": asdict(self.address) if self.address else None,
+            "language_preference": self.language_preference,
+            "consents": [
+                {
+                    "id": str(c.id),
+                    "consent_type": c.consent_type,
+                    "purpose": c.purpose,
+                    "granted_at": _iso(c.granted_at),
+                    "expires_at": _iso(c.expires_at),
+                    "revoked_at": _iso(c.revoked_at),
+                }
+                for c in self.consents
+            ],
+            "indexed_consent_ids": [
+                str(c.id) for c in self._active_consent_by_type.values()
+            ],
+            "emergency_contacts": [
+                {
+                    "id": str(c.id),
+                    "name": asdict(c.name),
+                    "phone": asdict(c.phone),
+                    "relationship": c.relationship,
+                    "is_primary": c.is_primary,
+                }
+                for c in self.emergency_contacts
+            ],
+            "primary_contact_id": (
+                str(self._primary_contact.id) if self._primary_contact else None
+            ),
+            "medical_history": {
+                "chronic_conditions": list(history.chronic_conditions),
+                "allergies": list(history.allergies),
+                "current_medications": list(history.current_medications),
+                "past_surgeries": list(history.past_surgeries),
+                "family_history": list(history.family_history),
+            },
+            "is_verified": self.is_verified,
+            "is_active": self.is_active,
+            "registered_at": _iso(self.registered_at),
+            "verified_at": _iso(self.verified_at),
+            "last_activity_at": _iso(self.last_activity_at),
+        }
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> 'Patient':
+        """
+        Rebuild an aggregate from to_snapshot() output.
+        Repositories then apply only events newer than snapshot["version"].
+        """
+        patient = cls(
+            id=UUID(snapshot["id"]),
+            phone=PhoneNumber(**snapshot["phone"]),
+            name=PatientName(**snapshot["name"]),
+            date_of_birth=DateOfBirth(date.fromisoformat(snapshot["date_of_birth"])),
+            gender=Gender(snapshot["gender"]),
+            email=EmailAddress(snapshot["email"]) if snapshot["email"] else None,
+            abha_number=ABHANumber(snapshot["abha_number"]) if snapshot["abha_number"] else None,
+            address=Address(**snapshot["address"]) if snapshot["address"] else None,
+            language_preference=snapshot["language_preference"],
+            version=snapshot["version"],
+        )
+        
+        indexed = set(snapshot["indexed_consent_ids"])
+        for data in snapshot["consents"]:
+            consent = Consent(
+                id=UUID(data["id"]),
+                patient_id=patient.id,
+                consent_type=data["consent_type"],
+                purpose=data["purpose"],
+                granted_at=_from_iso(data["granted_at"]),
+                expires_at=_from_iso(data["expires_at"]),
+                revoked_at=_from_iso(data["revoked_at"]),
+            )
+            patient.consents.append(consent)
+            if data["id"] in indexed:
+                patient._active_consent_by_type[consent.consent_type] = consent
+        
+        for data in snapshot["emergency_contacts"]:
+            contact = EmergencyContact(
+                id=UUID(data["id"]),
+                name=PatientName(**data["name"]),
+                phone=PhoneNumber(**data["phone"]),
+                relationship=data["relationship"],
+                is_primary=data["is_primary"],
+            )
+            patient.emergency_contacts.append(contact)
+            if data["id"] == snapshot["primary_contact_id"]:
+                patient._primary_contact = contact
+        
+        patient.medical_history = MedicalHistory(**snapshot["medical_history"])
+        patient.is_verified = snapshot["is_verified"]
+        patient.is_active = snapshot["is_active"]
+        patient.registered_at = _from_iso(snapshot["registered_at"])
+        patient.verified_at = _from_iso(snapshot["verified_at"])
+        patient.last_activity_at = _from_iso(snapshot["last_activity_at"])
+        
+        return patient
+    
     def validate_invariants(self) -> None:
         """Validate patient aggregate invariants."""
         # Invariant: Patient must be verified to have ABHA
@@ -254,32 +431,46 @@ class Patient(AggregateRoot):
             raise ValueError("Patient must be verified to link ABHA")
         
         # Invariant: Minor patients must have emergency contact
-        if self.date_of_birth.is_minor and not self.emergency_contacts:
+        if self.is_minor and not self.emergency_contacts:
             raise ValueError("Minor patients must have emergency contact")
         
-        # Invariant: Only one primary emergency contact
-        primary_count = sum(1 for c in self.emergency_contacts if c.is_primary)
-        if primary_count > 1:
-            raise ValueError("Only one primary emergency contact allowed")
+        # Invariant: Only one primary emergency contact is maintained by
+        # add_emergency_contact through _primary_contact
         
         # Invariant: Deactivated patients cannot be modified
         if not self.is_active and self._version > 0:
             raise ValueError("Cannot modify deactivated patient")
     
+    def _refresh_age(self, today: date) -> None:
+        """Recompute age-derived flags from date of birth."""
+        self._age_as_of = today
+        self._age = self.date_of_birth.calculate_age(today)
+        self._is_minor = self._age < 18
+        self._is_senior = self._age >= 60
+    
+    def _ensure_age_current(self) -> None:
+        """Refresh the age snapshot if the day has rolled over."""
+        today = date.today()
+        if today != self._age_as_of:
+            self._refresh_age(today)
+    
     @property
     def age(self) -> int:
         """Get patient's current age."""
-        return self.date_of_birth.age
+        self._ensure_age_current()
+        return self._age
     
     @property
     def is_minor(self) -> bool:
         """Check if patient is a minor."""
-        return self.date_of_birth.is_minor
+        self._ensure_age_current()
+        return self._is_minor
     
     @property
     def is_senior(self) -> bool:
         """Check if patient is a senior citizen."""
-        return self.date_of_birth.is_senior
+        self._ensure_age_current()
+        return self._is_senior
     
     @property
     def full_name(self) -> str:
@@ -0,0 +1,125 @@
+"""In-process caching decorator for the patient repository."""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.domain.patient.aggregate import Patient
+from app.domain.patient.repository import PatientRepository
+from app.domain.patient.value_objects import PhoneNumber, ABHANumber
+from app.domain.shared.aggregate_root import AggregateRoot
+from app.domain.shared.specification import Specification
+
+PATIENT_CACHE_MAXSIZE = 10_000
+PATIENT_CACHE_TTL_SECONDS = 30
+
+
+class CachingPatientRepository(PatientRepository):
+    """
+    Wraps a PatientRepository and memoizes find_by_id for a short TTL.
+    Entries hold snapshots, so every caller gets its own aggregate instance.
+    Writes made through a UnitOfWork invalidate entries once after_commit is
+    registered with unit_of_work.on_commit.
+    """
+    
+    def __init__(
+        self,
+        inner: PatientRepository,
+        maxsize: int = PATIENT_CACHE_MAXSIZE,
+        ttl_seconds: float = PATIENT_CACHE_TTL_SECONDS
+    ):
+        self.inner = inner
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._cache: "OrderedDict[UUID, Tuple[Dict[str, Any], float]]" = OrderedDict()
+    
+    def _put(self, patient: Patient) -> None:
+        self._cache[patient.id] = (patient.to_snapshot(), time.monotonic() + self.ttl_seconds)
+        self._cache.move_to_end(patient.id)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+    
+    def invalidate(self, patient_id: UUID) -> None:
+        """Drop a cached patient."""
+        self._cache.pop(patient_id, None)
+    
+    async def after_commit(self, aggregates: List[AggregateRoot]) -> None:
+        """Drop patients written by a unit of work commit."""
+        for aggregate in aggregates:
+            self.invalidate(aggregate.id)
+    
+    async def find_by_id(self, patient_id: UUID) -> Optional[Patient]:
+        entry = self._cache.get(patient_id)
+        if entry is not None:
+            snapshot, cached_until = entry
+            if time.monotonic() < cached_until:
+                self._cache.move_to_end(patient_id)
+                return Patient.from_snapshot(snapshot)
+            del self._cache[patient_id]
+        
+        patient = await self.inner.find_by_id(patient_id)
+        if patient is not None:
+            self._put(patient)
+        return patient
+    
+    async def find_by_phone(self, phone: PhoneNumber) -> Optional[Patient]:
+        return await self.inner.find_by_phone(phone)
+    
+    async def find_by_abha(self, abha: ABHANumber) -> Optional[Patient]:
+        return await self.inner.find_by_abha(abha)
+    
+    async def find_by_phone_or_abha(
+        self,
+        phone: PhoneNumber,
+        abha: Optional[ABHANumber] = None
+    ) -> Optional[Patient]:
+        return await self.inner.find_by_phone_or_abha(phone, abha)
+    
+    async def find_patients_needing_consent_renewal(
+        self,
+        days_before_expiry: int
+    ) -> List[UUID]:
+        return await self.inner.find_patients_needing_consent_renewal(days_before_expiry)
+    
+    async def find_by_specification(
+        self,
+        specification: Specification[Patient]
+    ) -> List[Patient]:
+        return await self.inner.find_by_specification(specification)
+    
+    async def find_ids_by_specification(
+        self,
+        specification: Specification[Patient]
+    ) -> List[UUID]:
+        return await self.inner.find_ids_by_specification(specification)
+    
+    async def find_with_active_consent(self, consent_type: str) -> List[Patient]:
+        return await self.inner.find_with_active_consent(consent_type)
+    
+    async def save(self, patient: Patient) -> None:
+        self.invalidate(patient.id)
+        await self.inner.save(patient)
+    
+    async def save_if_new(self, patient: Patient) -> bool:
+        self.invalidate(patient.id)
+        return await self.inner.save_if_new(patient)
+    
+    async def update(self, patient: Patient) -> None:
+        self.invalidate(patient.id)
+        await self.inner.update(patient)
+    
+    async def delete(self, patient_id: UUID) -> None:
+        self.invalidate(patient_id)
+        await self.inner.delete(patient_id)
+    
+    async def exists_by_phone(self, phone: PhoneNumber) -> bool:
+        return await self.inner.exists_by_phone(phone)
+    
+    async def exists_by_abha(self, abha: ABHANumber) -> bool:
+        return await self.inner.exists_by_abha(abha)
+    
+    async def count(self) -> int:
+        return await self.inner.count()
+    
+    async def count_active(self) -> int:
+        return await self.inner.count_active()
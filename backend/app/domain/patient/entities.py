@@ -1,8 +1,10 @@
 """Patient domain entities."""
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from uuid import UUID
 
+from app.domain.shared import clock
 from app.domain.shared.entity import Entity, DomainEvent
 from app.domain.patient.value_objects import (
     PhoneNumber, EmailAddress, ABHANumber, PatientName,
@@ -10,43 +12,46 @@ from app.domain.patient.value_objects import (
 )
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class PatientRegisteredEvent(DomainEvent):
     """Event raised when a new patient is registered."""
-    
-    def __init__(self, patient_id: UUID, phone: PhoneNumber, name: PatientName):
-        super().__init__(aggregate_id=patient_id)
-        self.phone = phone
-        self.name = name
+    phone_masked: str
+    full_name: str
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class PatientVerifiedEvent(DomainEvent):
     """Event raised when a patient is verified."""
-    
-    def __init__(self, patient_id: UUID, verification_method: str):
-        super().__init__(aggregate_id=patient_id)
-        self.verification_method = verification_method
+    verification_method: str
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class ConsentGrantedEvent(DomainEvent):
     """Event raised when patient grants consent."""
-    
-    def __init__(self, patient_id: UUID, consent_type: str, purpose: str):
-        super().__init__(aggregate_id=patient_id)
-        self.consent_type = consent_type
-        self.purpose = purpose
+    consent_type: str
+    purpose: str
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class ConsentRevokedEvent(DomainEvent):
     """Event raised when patient revokes consent."""
-    
-    def __init__(self, patient_id: UUID, consent_type: str):
-        super().__init__(aggregate_id=patient_id)
-        self.consent_type = consent_type
+    consent_type: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ConsentsRevokedEvent(DomainEvent):
+    """Event raised when patient revokes several consents at once."""
+    consent_types: Tuple[str, ...]
 
 
 class Consent(Entity):
     """Consent entity representing patient's consent for data processing."""
     
+    __slots__ = (
+        "patient_id", "consent_type", "purpose",
+        "granted_at", "revoked_at", "_expires_at", "_expires_at_ts",
+    )
+    
     def __init__(
         self,
         id: UUID,
@@ -65,26 +70,43 @@ class Consent(Entity):
         self.expires_at = expires_at
         self.revoked_at = revoked_at
     
+    @property
+    def expires_at(self) -> Optional[datetime]:
+        """Consent expiry, if any."""
+        return self._expires_at
+    
+    @expires_at.setter
+    def expires_at(self, value: Optional[datetime]) -> None:
+        self._expires_at = value
+        self._expires_at_ts = clock.to_timestamp(value) if value else None
+    
     @property
     def is_active(self) -> bool:
         """Check if consent is currently active."""
-        if self.revoked_at:
-            return False
-        if self.expires_at and datetime.utcnow() > self.expires_at:
-            return False
-        return True
+        return self.is_active_at_ts(clock.to_timestamp(clock.now()))
+    
+    def is_active_at(self, now: datetime) -> bool:
+        """Check if consent is active at the given time."""
+        return self.is_active_at_ts(clock.to_timestamp(now))
+    
+    def is_active_at_ts(self, now_ts: float) -> bool:
+        """Check if consent is active at the given epoch timestamp."""
+        return self.revoked_at is None and (
+            self._expires_at_ts is None or now_ts <= self._expires_at_ts
+        )
     
-    def revoke(self) -> None:
+    def revoke(self, now: Optional[datetime] = None) -> None:
         """Revoke this consent."""
         if self.revoked_at:
             raise ValueError("Consent already revoked")
-        self.revoked_at = datetime.utcnow()
+        self.revoked_at = now or clock.now()
     
     def extend(self, new_expiry: datetime) -> None:
         """Extend consent expiry."""
-        if not self.is_active:
+        now = clock.now()
+        if not self.is_active_at(now):
             raise ValueError("Cannot extend inactive consent")
-        if new_expiry <= datetime.utcnow():
+        if new_expiry <= now:
             raise ValueError("New expiry must be in the future")
         self.expires_at = new_expiry
 
@@ -92,6 +114,8 @@ class Consent(Entity):
 class EmergencyContact(Entity):
     """Emergency contact entity."""
     
+    __slots__ = ("name", "phone", "relationship", "is_primary")
+    
     def __init__(
         self,
         id: UUID,
@@ -118,6 +142,11 @@ class EmergencyContact(Entity):
 class MedicalHistory:
     """Medical history value object."""
     
+    __slots__ = (
+        "chronic_conditions", "past_surgeries", "family_history",
+        "_allergies", "_medications",
+    )
+    
     def __init__(
         self,
         chronic_conditions: List[str] = None,
@@ -127,32 +156,40 @@ class MedicalHistory:
         family_history: List[str] = None
     ):
         self.chronic_conditions = chronic_conditions or []
-        self.allergies = allergies or []
-        self.current_medications = current_medications or []
+        # Insertion-ordered dicts give de-duplicated lists with O(1) membership
+        self._allergies: Dict[str, None] = dict.fromkeys(allergies or ())
+        self._medications: Dict[str, None] = dict.fromkeys(current_medications or ())
         self.past_surgeries = past_surgeries or []
         self.family_history = family_history or []
     
+    @property
+    def allergies(self) -> Tuple[str, ...]:
+        """Recorded allergies, in the order they were added."""
+        return tuple(self._allergies)
+    
+    @property
+    def current_medications(self) -> Tuple[str, ...]:
+        """Current medications, in the order they were added."""
+        return tuple(self._medications)
+    
     def add_allergy(self, allergy: str) -> None:
         """Add a new allergy."""
-        if allergy not in self.allergies:
-            self.allergies.append(allergy)
+        self._allergies.setdefault(allergy)
     
     def add_medication(self, medication: str) -> None:
         """Add a current medication."""
-        if medication not in self.current_medications:
-            self.current_medications.append(medication)
+        self._medications.setdefault(medication)
     
     def remove_medication(self, medication: str) -> None:
         """Remove a medication."""
-        if medication in self.current_medications:
-            self.current_medications.remove(medication)
+        self._medications.pop(medication, None)
     
     @property
     def has_allergies(self) -> bool:
         """Check if patient has any allergies."""
-        return len(self.allergies) > 0
+        return bool(self._allergies)
     
     @property
     def has_chronic_conditions(self) -> bool:
         """Check if patient has chronic conditions."""
-        return len(self.chronic_conditions) > 0
\ No newline at end of file
+        return bool(self.chronic_conditions)
\ No newline at end of file
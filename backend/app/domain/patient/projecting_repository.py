@@ -0,0 +1,108 @@
+"""Patient repository decorator that keeps the eligibility projection current."""
+from typing import List, Optional
+from uuid import UUID
+
+from app.domain.patient.aggregate import Patient
+from app.domain.patient.read_models import PatientEligibilityReadModel
+from app.domain.patient.repository import (
+    PatientRepository,
+    PatientEligibilityReadRepository
+)
+from app.domain.patient.value_objects import PhoneNumber, ABHANumber
+from app.domain.shared.aggregate_root import AggregateRoot
+from app.domain.shared.specification import Specification
+
+
+class ProjectingPatientRepository(PatientRepository):
+    """
+    Wraps a PatientRepository and rewrites the eligibility row after every write,
+    so verify/deactivate/consent changes are visible to the read side.
+    Register after_commit with unit_of_work.on_commit to project unit of work saves.
+    """
+    
+    def __init__(
+        self,
+        inner: PatientRepository,
+        read_repository: PatientEligibilityReadRepository
+    ):
+        self.inner = inner
+        self.read_repository = read_repository
+    
+    async def _project(self, patient: Patient) -> None:
+        await self.read_repository.save(PatientEligibilityReadModel.from_patient(patient))
+    
+    async def after_commit(self, aggregates: List[AggregateRoot]) -> None:
+        """Project patients written by a unit of work commit."""
+        for aggregate in aggregates:
+            if isinstance(aggregate, Patient):
+                await self._project(aggregate)
+    
+    async def find_by_id(self, patient_id: UUID) -> Optional[Patient]:
+        return await self.inner.find_by_id(patient_id)
+    
+    async def find_by_phone(self, phone: PhoneNumber) -> Optional[Patient]:
+        return await self.inner.find_by_phone(phone)
+    
+    async def find_by_abha(self, abha: ABHANumber) -> Optional[Patient]:
+        return await self.inner.find_by_abha(abha)
+    
+    async def find_by_phone_or_abha(
+        self,
+        phone: PhoneNumber,
+        abha: Optional[ABHANumber] = None
+    ) -> Optional[Patient]:
+        return await self.inner.find_by_phone_or_abha(phone, abha)
+    
+    async def find_patients_needing_consent_renewal(
+        self,
+        days_before_expiry: int
+    ) -> List[UUID]:
+        return await self.inner.find_patients_needing_consent_renewal(days_before_expiry)
+    
+    async def find_by_specification(
+        self,
+        specification: Specification[Patient]
+    ) -> List[Patient]:
+        return await self.inner.find_by_specification(specification)
+    
+    async def find_ids_by_specification(
+        self,
+        specification: Specification[Patient]
+    ) -> List[UUID]:
+        return await self.inner.find_ids_by_specification(specification)
+    
+    async def find_with_active_consent(self, consent_type: str) -> List[Patient]:
+        return await self.inner.find_with_active_consent(consent_type)
+    
+    async def save(self, patient: Patient) -> None:
+        await self.inner.save(patient)
+        await self._project(patient)
+    
+    async def save_if_new(self, patient: Patient) -> bool:
+        if not await self.inner.save_if_new(patient):
+            return False
+        await self._project(patient)
+        return True
+    
+    async def update(self, patient: Patient) -> None:
+        await self.inner.update(patient)
+        await self._project(patient)
+    
+    async def delete(self, patient_id: UUID) -> None:
+        await self.inner.delete(patient_id)
+        # Deletes are soft, so re-project whatever state remains
+        patient = await self.inner.find_by_id(patient_id)
+        if patient is not None:
+            await self._project(patient)
+    
+    async def exists_by_phone(self, phone: PhoneNumber) -> bool:
+        return await self.inner.exists_by_phone(phone)
+    
+    async def exists_by_abha(self, abha: ABHANumber) -> bool:
+        return await self.inner.exists_by_abha(abha)
+    
+    async def count(self) -> int:
+        return await self.inner.count()
+    
+    async def count_active(self) -> int:
+        return await self.inner.count_active()
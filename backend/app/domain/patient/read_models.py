@@ -0,0 +1,49 @@
+"""Patient read models (projections)."""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Mapping, Optional
+from uuid import UUID
+
+from app.domain.shared import clock
+from app.domain.patient.aggregate import Patient
+from app.domain.patient.value_objects import DateOfBirth
+
+
+@dataclass(frozen=True, slots=True)
+class PatientEligibilityReadModel:
+    """Denormalized row answering eligibility checks without loading the aggregate."""
+    
+    patient_id: UUID
+    is_active: bool
+    is_verified: bool
+    date_of_birth: DateOfBirth
+    has_emergency_contact: bool
+    # Unrevoked consent types mapped to their expiry (None = no expiry)
+    consent_expiry: Mapping[str, Optional[datetime]]
+    
+    @classmethod
+    def from_patient(cls, patient: Patient) -> 'PatientEligibilityReadModel':
+        """Project the aggregate's current state."""
+        return cls(
+            patient_id=patient.id,
+            is_active=patient.is_active,
+            is_verified=patient.is_verified,
+            date_of_birth=patient.date_of_birth,
+            has_emergency_contact=bool(patient.emergency_contacts),
+            consent_expiry={
+                consent.consent_type: consent.expires_at
+                for consent in patient.get_active_consents()
+            },
+        )
+    
+    @property
+    def is_minor(self) -> bool:
+        """Check if patient is a minor."""
+        return self.date_of_birth.is_minor
+    
+    def has_active_consent(self, consent_type: str) -> bool:
+        """Check if patient has active consent for a type."""
+        if consent_type not in self.consent_expiry:
+            return False
+        expires_at = self.consent_expiry[consent_type]
+        return expires_at is None or clock.now() <= expires_at
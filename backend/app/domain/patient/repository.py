@@ -4,7 +4,12 @@ from typing import Optional, List
 from uuid import UUID
 
 from app.domain.patient.aggregate import Patient
+from app.domain.patient.read_models import PatientEligibilityReadModel
 from app.domain.patient.value_objects import PhoneNumber, ABHANumber
+from app.domain.patient.specifications import (
+    PatientsNeedingConsentRenewalSpecification,
+    PatientsWithConsentSpecification
+)
 from app.domain.shared.specification import Specification
 
 
@@ -26,19 +31,79 @@ class PatientRepository(ABC):
         """Find patient by ABHA number."""
         pass
     
+    async def find_by_phone_or_abha(
+        self,
+        phone: PhoneNumber,
+        abha: Optional[ABHANumber] = None
+    ) -> Optional[Patient]:
+        """
+        Find patient by phone or ABHA, preferring a phone match.
+        Override to do both lookups in one query.
+        """
+        patient = await self.find_by_phone(phone)
+        if patient is None and abha is not None:
+            patient = await self.find_by_abha(abha)
+        return patient
+    
     @abstractmethod
     async def find_by_specification(
         self,
         specification: Specification[Patient]
     ) -> List[Patient]:
-        """Find patients matching specification."""
+        """
+        Find patients matching specification.
+        SQL-backed repositories filter with specification.to_sql() and fall back
+        to is_satisfied_by when it returns None.
+        """
         pass
     
+    async def find_ids_by_specification(
+        self,
+        specification: Specification[Patient]
+    ) -> List[UUID]:
+        """
+        Find IDs of patients matching specification, for read-only callers.
+        Override to select only the id column instead of loading aggregates.
+        """
+        return [patient.id for patient in await self.find_by_specification(specification)]
+    
+    async def find_with_active_consent(self, consent_type: str) -> List[Patient]:
+        """Find patients holding an active consent of the given type."""
+        return await self.find_by_specification(
+            PatientsWithConsentSpecification(consent_type)
+        )
+    
+    async def find_patients_needing_consent_renewal(
+        self,
+        days_before_expiry: int
+    ) -> List[UUID]:
+        """
+        Find IDs of patients with an unrevoked consent expiring within the window.
+        Override to read consents directly (SELECT DISTINCT patient_id ... WHERE
+        revoked_at IS NULL AND expires_at in range) using ix_consents_expires_at_unrevoked.
+        """
+        return await self.find_ids_by_specification(
+            PatientsNeedingConsentRenewalSpecification(days_before_expiry)
+        )
+    
     @abstractmethod
     async def save(self, patient: Patient) -> None:
-        """Save patient aggregate."""
+        """Save patient aggregate, including its active_consent_types column."""
         pass
     
+    async def save_if_new(self, patient: Patient) -> bool:
+        """
+        Insert patient unless the phone or ABHA number is already registered.
+        Returns False on conflict. Override with INSERT ... ON CONFLICT DO NOTHING
+        RETURNING to check and insert in one statement.
+        """
+        if await self.exists_by_phone(patient.phone):
+            return False
+        if patient.abha_number is not None and await self.exists_by_abha(patient.abha_number):
+            return False
+        await self.save(patient)
+        return True
+    
     @abstractmethod
     async def update(self, patient: Patient) -> None:
         """Update patient aggregate with optimistic locking."""
@@ -67,4 +132,18 @@ class PatientRepository(ABC):
     @abstractmethod
     async def count_active(self) -> int:
         """Count active patients."""
+        pass
+
+
+class PatientEligibilityReadRepository(ABC):
+    """Repository for the patient eligibility projection."""
+    
+    @abstractmethod
+    async def get(self, patient_id: UUID) -> Optional[PatientEligibilityReadModel]:
+        """Get the eligibility row for a patient."""
+        pass
+    
+    @abstractmethod
+    async def save(self, read_model: PatientEligibilityReadModel) -> None:
+        """Insert or replace the eligibility row for a patient."""
         pass
\ No newline at end of file
@@ -2,16 +2,21 @@
 from typing import Optional, List
 from uuid import UUID, uuid4
 
+from app.domain.shared.unit_of_work import UnitOfWork
 from app.domain.patient.aggregate import Patient
-from app.domain.patient.repository import PatientRepository
+from app.domain.patient.read_models import PatientEligibilityReadModel
+from app.domain.patient.repository import (
+    PatientRepository,
+    PatientEligibilityReadRepository
+)
 from app.domain.patient.value_objects import (
     PhoneNumber, EmailAddress, PatientName,
     DateOfBirth, Gender, ABHANumber
 )
 from app.domain.patient.specifications import (
-    ActivePatientsSpecification,
-    VerifiedPatientsSpecification,
-    MinorPatientsSpecification
+    ACTIVE_PATIENTS,
+    VERIFIED_PATIENTS,
+    MINOR_PATIENTS
 )
 
 
@@ -35,18 +40,7 @@ class PatientDuplicationChecker:
         abha: Optional[ABHANumber] = None
     ) -> Optional[Patient]:
         """Find existing patient by phone or ABHA."""
-        # Check by phone first
-        patient = await self.repository.find_by_phone(phone)
-        if patient:
-            return patient
-        
-        # Check by ABHA if provided
-        if abha:
-            patient = await self.repository.find_by_abha(abha)
-            if patient:
-                return patient
-        
-        return None
+        return await self.repository.find_by_phone_or_abha(phone, abha)
 
 
 class PatientRegistrationService:
@@ -55,10 +49,12 @@ class PatientRegistrationService:
     def __init__(
         self,
         repository: PatientRepository,
-        duplication_checker: PatientDuplicationChecker
+        duplication_checker: PatientDuplicationChecker,
+        unit_of_work: Optional[UnitOfWork] = None
     ):
         self.repository = repository
         self.duplication_checker = duplication_checker
+        self.unit_of_work = unit_of_work
     
     async def register_patient(
         self,
@@ -70,11 +66,6 @@ class PatientRegistrationService:
         abha: Optional[ABHANumber] = None
     ) -> Patient:
         """Register a new patient with deduplication check."""
-        # Check for existing patient
-        existing = await self.duplication_checker.find_existing_patient(phone, abha)
-        if existing:
-            raise ValueError(f"Patient already exists with phone {phone.masked}")
-        
         # Create new patient
         patient = Patient.register(
             id=uuid4(),
@@ -91,17 +82,67 @@ class PatientRegistrationService:
             # as it's part of the registration process
             patient.abha_number = abha
         
-        # Save patient
-        await self.repository.save(patient)
+        if self.unit_of_work is not None:
+            # Written on commit; the unique indexes still reject a racing duplicate
+            if await self.duplication_checker.is_duplicate_phone(phone):
+                raise ValueError(f"Patient already exists with phone {phone.masked}")
+            if abha and await self.duplication_checker.is_duplicate_abha(abha):
+                raise ValueError(f"Patient already exists with ABHA {abha.masked}")
+            self.unit_of_work.register(patient)
+            return patient
+        
+        # Save patient; the insert itself rejects duplicate phone/ABHA
+        if not await self.repository.save_if_new(patient):
+            # Only on conflict: work out which identifier is taken
+            if abha and not await self.duplication_checker.is_duplicate_phone(phone):
+                raise ValueError(f"Patient already exists with ABHA {abha.masked}")
+            raise ValueError(f"Patient already exists with phone {phone.masked}")
         
         return patient
 
 
+async def _load_eligibility(
+    repository: PatientRepository,
+    read_repository: Optional[PatientEligibilityReadRepository],
+    patient_id: UUID
+) -> Optional[PatientEligibilityReadModel]:
+    """Read the eligibility projection, projecting the aggregate when no row exists."""
+    if read_repository is not None:
+        eligibility = await read_repository.get(patient_id)
+        if eligibility is not None:
+            return eligibility
+    
+    patient = await repository.find_by_id(patient_id)
+    if not patient:
+        return None
+    return PatientEligibilityReadModel.from_patient(patient)
+
+
 class PatientConsentService:
     """Domain service for managing patient consents."""
     
-    def __init__(self, repository: PatientRepository):
+    def __init__(
+        self,
+        repository: PatientRepository,
+        read_repository: Optional[PatientEligibilityReadRepository] = None,
+        unit_of_work: Optional[UnitOfWork] = None
+    ):
         self.repository = repository
+        self.read_repository = read_repository
+        self.unit_of_work = unit_of_work
+    
+    async def _save(self, patient: Patient) -> None:
+        """
+        Persist the aggregate.
+        The eligibility row is refreshed by ProjectingPatientRepository, or by its
+        after_commit hook for saves registered with the unit of work.
+        """
+        if self.unit_of_work is not None:
+            # Written with the rest of the request's changes on commit
+            self.unit_of_work.register(patient)
+            return
+        
+        await self.repository.update(patient)
     
     async def grant_intake_consent(
         self,
@@ -113,29 +154,32 @@ class PatientConsentService:
         if not patient:
             raise ValueError(f"Patient {patient_id} not found")
         
-        # Grant consent for intake
-        patient.grant_consent(
-            consent_id=uuid4(),
-            consent_type="ai_intake",
-            purpose=purpose
-        )
-        
-        # Grant consent for data processing
-        patient.grant_consent(
-            consent_id=uuid4(),
-            consent_type="data_processing",
-            purpose="Process medical information for healthcare delivery"
-        )
+        with patient.command_scope():
+            # Grant consent for intake
+            patient.grant_consent(
+                consent_id=uuid4(),
+                consent_type="ai_intake",
+                purpose=purpose
+            )
+            
+            # Grant consent for data processing
+            patient.grant_consent(
+                consent_id=uuid4(),
+                consent_type="data_processing",
+                purpose="Process medical information for healthcare delivery"
+            )
         
-        await self.repository.update(patient)
+        await self._save(patient)
     
     async def check_intake_consent(self, patient_id: UUID) -> bool:
         """Check if patient has consent for AI intake."""
-        patient = await self.repository.find_by_id(patient_id)
-        if not patient:
+        eligibility = await _load_eligibility(
+            self.repository, self.read_repository, patient_id
+        )
+        if not eligibility:
             return False
         
-        return patient.has_active_consent("ai_intake")
+        return eligibility.has_active_consent("ai_intake")
     
     async def revoke_all_consents(self, patient_id: UUID) -> None:
         """Revoke all patient consents."""
@@ -143,22 +187,27 @@ class PatientConsentService:
         if not patient:
             raise ValueError(f"Patient {patient_id} not found")
         
-        # Revoke all active consents
-        for consent in patient.get_active_consents():
-            patient.revoke_consent(consent.consent_type)
+        patient.revoke_all_active_consents()
         
-        await self.repository.update(patient)
+        await self._save(patient)
 
 
 class PatientEligibilityService:
     """Domain service to check patient eligibility for services."""
     
-    def __init__(self, repository: PatientRepository):
+    def __init__(
+        self,
+        repository: PatientRepository,
+        read_repository: Optional[PatientEligibilityReadRepository] = None
+    ):
         self.repository = repository
+        self.read_repository = read_repository
     
     async def is_eligible_for_telehealth(self, patient_id: UUID) -> bool:
         """Check if patient is eligible for telehealth services."""
-        patient = await self.repository.find_by_id(patient_id)
+        patient = await _load_eligibility(
+            self.repository, self.read_repository, patient_id
+        )
         if not patient:
             return False
         
@@ -180,7 +229,9 @@ class PatientEligibilityService:
     
     async def is_eligible_for_ai_intake(self, patient_id: UUID) -> bool:
         """Check if patient is eligible for AI intake."""
-        patient = await self.repository.find_by_id(patient_id)
+        patient = await _load_eligibility(
+            self.repository, self.read_repository, patient_id
+        )
         if not patient:
             return False
         
@@ -194,7 +245,7 @@ class PatientEligibilityService:
         # Additional checks for minors
         if patient.is_minor:
             # Must have emergency contact
-            if not patient.emergency_contacts:
+            if not patient.has_emergency_contact:
                 return False
             # Must have guardian consent
             if not patient.has_active_consent("guardian_consent"):
@@ -211,21 +262,23 @@ class PatientSearchService:
     
     async def find_active_patients(self) -> List[Patient]:
         """Find all active patients."""
-        spec = ActivePatientsSpecification()
-        return await self.repository.find_by_specification(spec)
+        return await self.repository.find_by_specification(ACTIVE_PATIENTS)
+    
+    async def find_active_patient_ids(self) -> List[UUID]:
+        """Find IDs of all active patients without loading aggregates."""
+        return await self.repository.find_ids_by_specification(ACTIVE_PATIENTS)
     
     async def find_verified_patients(self) -> List[Patient]:
         """Find all verified patients."""
-        spec = VerifiedPatientsSpecification()
-        return await self.repository.find_by_specification(spec)
+        return await self.repository.find_by_specification(VERIFIED_PATIENTS)
     
     async def find_minor_patients(self) -> List[Patient]:
         """Find all minor patients."""
-        spec = MinorPatientsSpecification()
-        return await self.repository.find_by_specification(spec)
-    
-    async def find_patients_needing_consent_renewal(self) -> List[Patient]:
-        """Find patients whose consents are expiring soon."""
-        # This would use a more complex specification
-        # checking consent expiry dates
-        pass
\ No newline at end of file
+        return await self.repository.find_by_specification(MINOR_PATIENTS)
+    
+    async def find_patients_needing_consent_renewal(
+        self,
+        days_before_expiry: int = 7
+    ) -> List[UUID]:
+        """Find IDs of patients whose consents are expiring soon."""
+        return await self.repository.find_patients_needing_consent_renewal(days_before_expiry)
\ No newline at end of file
@@ -1,53 +1,115 @@
 """Patient specifications for queries."""
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from typing import Optional
 
-from app.domain.shared.specification import Specification
+from app.domain.shared import clock
+from app.domain.shared.specification import Specification, SqlPredicate
 from app.domain.patient.aggregate import Patient
 
+MINOR_AGE_YEARS = 18
+SENIOR_AGE_YEARS = 60
+
+# Timestamps are stored as naive UTC, matching clock.now()
+_SQL_UTC_NOW = "(now() AT TIME ZONE 'utc')"
+
+
+def _birth_date_cutoff(years: int) -> date:
+    """Latest date of birth for someone who is at least ``years`` old today."""
+    today = date.today()
+    try:
+        return today.replace(year=today.year - years)
+    except ValueError:
+        # Feb 29 -> Feb 28 in a non-leap year
+        return today.replace(year=today.year - years, day=28)
+
+
+def _active_consent_exists(consent_type: str) -> SqlPredicate:
+    # The GIN-indexed array narrows candidates; the subquery rechecks expiry.
+    # Composites rename :consent_type when two consent types are combined.
+    sql = (
+        "patients.active_consent_types @> ARRAY[CAST(:consent_type AS text)]"
+        " AND EXISTS (SELECT 1 FROM consents"
+        " WHERE consents.patient_id = patients.id"
+        " AND consents.consent_type = :consent_type"
+        " AND consents.revoked_at IS NULL"
+        f" AND (consents.expires_at IS NULL OR consents.expires_at > {_SQL_UTC_NOW}))"
+    )
+    return sql, {"consent_type": consent_type}
+
 
 class ActivePatientsSpecification(Specification[Patient]):
     """Specification for active patients."""
     
+    __slots__ = ()
+    
     def is_satisfied_by(self, patient: Patient) -> bool:
         return patient.is_active
+    
+    def to_sql(self) -> SqlPredicate:
+        return "patients.is_active IS TRUE", {}
 
 
 class VerifiedPatientsSpecification(Specification[Patient]):
     """Specification for verified patients."""
     
+    __slots__ = ()
+    
     def is_satisfied_by(self, patient: Patient) -> bool:
         return patient.is_verified
+    
+    def to_sql(self) -> SqlPredicate:
+        return "patients.is_verified IS TRUE", {}
 
 
 class MinorPatientsSpecification(Specification[Patient]):
     """Specification for minor patients."""
     
+    __slots__ = ()
+    
     def is_satisfied_by(self, patient: Patient) -> bool:
         return patient.is_minor
+    
+    def to_sql(self) -> SqlPredicate:
+        cutoff = _birth_date_cutoff(MINOR_AGE_YEARS)
+        return "patients.date_of_birth > :minor_dob_cutoff", {"minor_dob_cutoff": cutoff}
 
 
 class SeniorPatientsSpecification(Specification[Patient]):
     """Specification for senior citizen patients."""
     
+    __slots__ = ()
+    
     def is_satisfied_by(self, patient: Patient) -> bool:
         return patient.is_senior
+    
+    def to_sql(self) -> SqlPredicate:
+        cutoff = _birth_date_cutoff(SENIOR_AGE_YEARS)
+        return "patients.date_of_birth <= :senior_dob_cutoff", {"senior_dob_cutoff": cutoff}
 
 
 class PatientsWithABHASpecification(Specification[Patient]):
     """Specification for patients with ABHA number."""
     
+    __slots__ = ()
+    
     def is_satisfied_by(self, patient: Patient) -> bool:
         return patient.abha_number is not None
+    
+    def to_sql(self) -> SqlPredicate:
+        return "patients.abha_number IS NOT NULL", {}
 
 
 class RecentlyActiveSpecification(Specification[Patient]):
     """Specification for recently active patients."""
     
     def __init__(self, days: int = 30):
-        self.cutoff_date = datetime.utcnow() - timedelta(days=days)
+        self.cutoff_date = clock.now() - timedelta(days=days)
     
     def is_satisfied_by(self, patient: Patient) -> bool:
         return patient.last_activity_at > self.cutoff_date
+    
+    def to_sql(self) -> SqlPredicate:
+        return "patients.last_activity_at > :activity_cutoff", {"activity_cutoff": self.cutoff_date}
 
 
 class PatientsWithConsentSpecification(Specification[Patient]):
@@ -58,25 +120,40 @@ class PatientsWithConsentSpecification(Specification[Patient]):
     
     def is_satisfied_by(self, patient: Patient) -> bool:
         return patient.has_active_consent(self.consent_type)
+    
+    def to_sql(self) -> SqlPredicate:
+        return _active_consent_exists(self.consent_type)
 
 
 class PatientsNeedingConsentRenewalSpecification(Specification[Patient]):
     """Specification for patients whose consents expire soon."""
     
     def __init__(self, days_before_expiry: int = 7):
-        self.expiry_threshold = datetime.utcnow() + timedelta(days=days_before_expiry)
+        self.expiry_threshold = clock.now() + timedelta(days=days_before_expiry)
     
     def is_satisfied_by(self, patient: Patient) -> bool:
-        for consent in patient.consents:
-            if consent.is_active and consent.expires_at:
+        for consent in patient.get_active_consents():
+            if consent.expires_at:
                 if consent.expires_at <= self.expiry_threshold:
                     return True
         return False
+    
+    def to_sql(self) -> SqlPredicate:
+        sql = (
+            "EXISTS (SELECT 1 FROM consents"
+            " WHERE consents.patient_id = patients.id"
+            " AND consents.revoked_at IS NULL"
+            f" AND consents.expires_at > {_SQL_UTC_NOW}"
+            " AND consents.expires_at <= :consent_expiry_threshold)"
+        )
+        return sql, {"consent_expiry_threshold": self.expiry_threshold}
 
 
 class EligibleForTelehealthSpecification(Specification[Patient]):
     """Specification for patients eligible for telehealth."""
     
+    __slots__ = ()
+    
     def is_satisfied_by(self, patient: Patient) -> bool:
         # Must be active and verified
         if not patient.is_active or not patient.is_verified:
@@ -90,4 +167,25 @@ class EligibleForTelehealthSpecification(Specification[Patient]):
         if patient.is_minor and not patient.has_active_consent("guardian_consent"):
             return False
         
-        return True
\ No newline at end of file
+        return True
+    
+    def to_sql(self) -> Optional[SqlPredicate]:
+        spec = (
+            ACTIVE_PATIENTS
+            .and_(VERIFIED_PATIENTS)
+            .and_(PatientsWithConsentSpecification("telehealth"))
+            .and_(
+                MINOR_PATIENTS.not_()
+                .or_(PatientsWithConsentSpecification("guardian_consent"))
+            )
+        )
+        return spec.to_sql()
+
+
+# Shared instances of the stateless specifications
+ACTIVE_PATIENTS = ActivePatientsSpecification()
+VERIFIED_PATIENTS = VerifiedPatientsSpecification()
+MINOR_PATIENTS = MinorPatientsSpecification()
+SENIOR_PATIENTS = SeniorPatientsSpecification()
+PATIENTS_WITH_ABHA = PatientsWithABHASpecification()
+ELIGIBLE_FOR_TELEHEALTH = EligibleForTelehealthSpecification()
\ No newline at end of file
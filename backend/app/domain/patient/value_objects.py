@@ -1,11 +1,36 @@
 """Value objects for Patient domain."""
 import re
+import string
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import date, datetime
 from typing import Optional
 
 from app.domain.shared.value_object import ValueObject
 
+_PHONE_SEPARATORS = str.maketrans('', '', ' \t\n\r\f\v-')
+_NAME_RE = re.compile(r"^[a-zA-Z\s'-]+$")
+
+# Allowed bytes per email part; translate(None, allowed) leaves only invalid bytes
+_EMAIL_LOCAL_BYTES = (string.ascii_letters + string.digits + "._%+-").encode()
+_EMAIL_HOST_BYTES = (string.ascii_letters + string.digits + ".-").encode()
+_EMAIL_TLD_BYTES = string.ascii_letters.encode()
+
+
+def _is_valid_email(value: str) -> bool:
+    """Single-pass equivalent of ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$."""
+    if not value.isascii():
+        return False
+    local, at, domain = value.encode().partition(b'@')
+    if not at or not local or local.translate(None, _EMAIL_LOCAL_BYTES):
+        return False
+    host, dot, tld = domain.rpartition(b'.')
+    return bool(
+        dot and host and len(tld) >= 2
+        and not tld.translate(None, _EMAIL_TLD_BYTES)
+        and not host.translate(None, _EMAIL_HOST_BYTES)
+    )
+
 
 @dataclass(frozen=True)
 class PhoneNumber(ValueObject):
@@ -16,24 +41,32 @@ class PhoneNumber(ValueObject):
     
     def validate(self) -> None:
         """Validate Indian phone number format."""
-        # Remove spaces and hyphens
-        clean_number = re.sub(r'[\s-]', '', self.number)
+        clean_number = self.digits
         
-        # Indian phone number validation
-        if not re.match(r'^[6-9]\d{9}$', clean_number):
+        # Indian phone number validation: 10 digits starting with 6-9
+        if not (
+            len(clean_number) == 10
+            and clean_number.isascii()
+            and clean_number.isdigit()
+            and clean_number[0] in '6789'
+        ):
             raise ValueError(f"Invalid Indian phone number: {self.number}")
     
-    @property
+    @cached_property
+    def digits(self) -> str:
+        """Return the number with spaces and hyphens removed."""
+        return self.number.translate(_PHONE_SEPARATORS)
+    
+    @cached_property
     def formatted(self) -> str:
         """Return formatted phone number."""
-        clean = re.sub(r'[\s-]', '', self.number)
+        clean = self.digits
         return f"{self.country_code} {clean[:5]} {clean[5:]}"
     
-    @property
+    @cached_property
     def masked(self) -> str:
         """Return masked phone number for display."""
-        clean = re.sub(r'[\s-]', '', self.number)
-        return f"{self.country_code} XXXXX {clean[-4:]}"
+        return f"{self.country_code} XXXXX {self.digits[-4:]}"
 
 
 @dataclass(frozen=True)
@@ -44,8 +77,7 @@ class EmailAddress(ValueObject):
     
     def validate(self) -> None:
         """Validate email format."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, self.value):
+        if not _is_valid_email(self.value):
             raise ValueError(f"Invalid email address: {self.value}")
     
     @property
@@ -53,7 +85,7 @@ class EmailAddress(ValueObject):
         """Extract domain from email."""
         return self.value.split('@')[1]
     
-    @property
+    @cached_property
     def masked(self) -> str:
         """Return masked email for display."""
         local, domain = self.value.split('@')
@@ -72,20 +104,20 @@ class ABHANumber(ValueObject):
     
     def validate(self) -> None:
         """Validate ABHA number format (14 digits or 17 with hyphens)."""
-        clean = re.sub(r'-', '', self.value)
-        if not re.match(r'^\d{14}$', clean):
+        clean = self.value.replace('-', '')
+        if not (len(clean) == 14 and clean.isascii() and clean.isdigit()):
             raise ValueError(f"Invalid ABHA number: {self.value}")
     
-    @property
+    @cached_property
     def formatted(self) -> str:
         """Return formatted ABHA number (XX-XXXX-XXXX-XXXX)."""
-        clean = re.sub(r'-', '', self.value)
+        clean = self.value.replace('-', '')
         return f"{clean[:2]}-{clean[2:6]}-{clean[6:10]}-{clean[10:]}"
     
-    @property
+    @cached_property
     def masked(self) -> str:
         """Return masked ABHA for display."""
-        clean = re.sub(r'-', '', self.value)
+        clean = self.value.replace('-', '')
         return f"XX-XXXX-XXXX-{clean[-4:]}"
 
 
@@ -105,15 +137,14 @@ class PatientName(ValueObject):
             raise ValueError("Last name is required")
         
         # Check for valid characters (letters, spaces, apostrophes, hyphens)
-        name_pattern = r"^[a-zA-Z\s'-]+$"
-        if not re.match(name_pattern, self.first_name):
+        if not _NAME_RE.match(self.first_name):
             raise ValueError(f"Invalid first name: {self.first_name}")
-        if not re.match(name_pattern, self.last_name):
+        if not _NAME_RE.match(self.last_name):
             raise ValueError(f"Invalid last name: {self.last_name}")
-        if self.middle_name and not re.match(name_pattern, self.middle_name):
+        if self.middle_name and not _NAME_RE.match(self.middle_name):
             raise ValueError(f"Invalid middle name: {self.middle_name}")
     
-    @property
+    @cached_property
     def full_name(self) -> str:
         """Return full name."""
         parts = [self.first_name]
@@ -122,7 +153,7 @@ class PatientName(ValueObject):
         parts.append(self.last_name)
         return " ".join(parts)
     
-    @property
+    @cached_property
     def initials(self) -> str:
         """Return initials."""
         initials = self.first_name[0].upper()
@@ -144,13 +175,13 @@ class DateOfBirth(ValueObject):
             raise ValueError("Date of birth cannot be in the future")
         
         # Check for reasonable age (0-150 years)
-        age = self.calculate_age()
+        age = self.age
         if age < 0 or age > 150:
             raise ValueError(f"Invalid age: {age}")
     
-    def calculate_age(self) -> int:
-        """Calculate current age."""
-        today = date.today()
+    def calculate_age(self, today: Optional[date] = None) -> int:
+        """Calculate age as of today (or the given date)."""
+        today = today or date.today()
         age = today.year - self.value.year
         if (today.month, today.day) < (self.value.month, self.value.day):
             age -= 1
@@ -158,8 +189,14 @@ class DateOfBirth(ValueObject):
     
     @property
     def age(self) -> int:
-        """Current age."""
-        return self.calculate_age()
+        """Current age, computed at most once per day per instance."""
+        today = date.today()
+        age_as_of, age = self.__dict__.get("_age_snapshot", (None, 0))
+        if age_as_of != today:
+            age = self.calculate_age(today)
+            # Frozen dataclass: cache outside the compared fields
+            object.__setattr__(self, "_age_snapshot", (today, age))
+        return age
     
     @property
     def is_minor(self) -> bool:
@@ -202,6 +239,19 @@ class Gender(ValueObject):
         return pronouns.get(self.normalized, "they/them")
 
 
+_INDIAN_STATES = frozenset({
+    "Andhra Pradesh", "Arunachal Pradesh", "Assam", "Bihar", "Chhattisgarh",
+    "Goa", "Gujarat", "Haryana", "Himachal Pradesh", "Jharkhand", "Karnataka",
+    "Kerala", "Madhya Pradesh", "Maharashtra", "Manipur", "Meghalaya", "Mizoram",
+    "Nagaland", "Odisha", "Punjab", "Rajasthan", "Sikkim", "Tamil Nadu",
+    "Telangana", "Tripura", "Uttar Pradesh", "Uttarakhand", "West Bengal",
+    "Andaman and Nicobar Islands", "Chandigarh", "Dadra and Nagar Haveli and Daman and Diu",
+    "Delhi", "Jammu and Kashmir", "Ladakh", "Lakshadweep", "Puducherry"
+})
+# Lowercased lookup key -> canonical spelling
+_INDIAN_STATES_BY_KEY = {state.lower(): state for state in _INDIAN_STATES}
+
+
 @dataclass(frozen=True)
 class Address(ValueObject):
     """Address value object for Indian addresses."""
@@ -213,15 +263,14 @@ class Address(ValueObject):
     pincode: str
     country: str = "India"
     
-    INDIAN_STATES = {
-        "Andhra Pradesh", "Arunachal Pradesh", "Assam", "Bihar", "Chhattisgarh",
-        "Goa", "Gujarat", "Haryana", "Himachal Pradesh", "Jharkhand", "Karnataka",
-        "Kerala", "Madhya Pradesh", "Maharashtra", "Manipur", "Meghalaya", "Mizoram",
-        "Nagaland", "Odisha", "Punjab", "Rajasthan", "Sikkim", "Tamil Nadu",
-        "Telangana", "Tripura", "Uttar Pradesh", "Uttarakhand", "West Bengal",
-        "Andaman and Nicobar Islands", "Chandigarh", "Dadra and Nagar Haveli and Daman and Diu",
-        "Delhi", "Jammu and Kashmir", "Ladakh", "Lakshadweep", "Puducherry"
-    }
+    INDIAN_STATES = _INDIAN_STATES
+    
+    def __post_init__(self):
+        """Store the canonical state spelling, then validate."""
+        canonical = _INDIAN_STATES_BY_KEY.get(self.state.strip().lower()) if self.state else None
+        if canonical is not None:
+            object.__setattr__(self, "state", canonical)
+        super().__post_init__()
     
     def validate(self) -> None:
         """Validate Indian address."""
@@ -233,10 +282,11 @@ class Address(ValueObject):
             raise ValueError(f"Invalid Indian state: {self.state}")
         
         # Validate Indian pincode (6 digits)
-        if not re.match(r'^\d{6}$', self.pincode):
+        pincode = self.pincode
+        if not (len(pincode) == 6 and pincode.isascii() and pincode.isdigit()):
             raise ValueError(f"Invalid Indian pincode: {self.pincode}")
     
-    @property
+    @cached_property
     def formatted(self) -> str:
         """Return formatted address."""
         lines = [self.line1]
@@ -246,7 +296,7 @@ class Address(ValueObject):
         lines.append(self.country)
         return "\n".join(lines)
     
-    @property
+    @cached_property
     def single_line(self) -> str:
         """Return single-line address."""
         parts = [self.line1]
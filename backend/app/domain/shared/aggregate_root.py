@@ -1,5 +1,6 @@
 """Aggregate Root base class following DDD principles."""
-from typing import List
+from contextlib import contextmanager
+from typing import Iterator, List
 from uuid import UUID
 
 from app.domain.shared.entity import Entity, DomainEvent
@@ -8,9 +9,13 @@ from app.domain.shared.entity import Entity, DomainEvent
 class AggregateRoot(Entity):
     """Base class for aggregate roots."""
     
+    __slots__ = ("_version", "_command_depth", "_version_pending")
+    
     def __init__(self, id: UUID = None, version: int = 0):
         super().__init__(id)
         self._version = version
+        self._command_depth = 0
+        self._version_pending = False
     
     @property
     def version(self) -> int:
@@ -19,7 +24,25 @@ class AggregateRoot(Entity):
     
     def increment_version(self) -> None:
         """Increment version for optimistic locking."""
-        self._version += 1
+        if self._command_depth:
+            self._version_pending = True
+        else:
+            self._version += 1
+    
+    @contextmanager
+    def command_scope(self) -> Iterator[None]:
+        """
+        Group several mutations into one command.
+        Version increments inside the block collapse into a single bump on exit.
+        """
+        self._command_depth += 1
+        try:
+            yield
+        finally:
+            self._command_depth -= 1
+            if not self._command_depth and self._version_pending:
+                self._version_pending = False
+                self._version += 1
     
     def validate_invariants(self) -> None:
         """
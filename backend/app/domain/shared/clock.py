@@ -0,0 +1,19 @@
+"""Domain clock.
+
+Domain code reads the current time through ``now()`` so a command takes one
+timestamp and reuses it. Event replay can patch ``now`` to return the
+recorded event time.
+"""
+from datetime import datetime
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def now() -> datetime:
+    """Current UTC time (naive, matching ``datetime.utcnow``)."""
+    return datetime.utcnow()
+
+
+def to_timestamp(value: datetime) -> float:
+    """Seconds since the epoch for a naive UTC datetime."""
+    return (value - _EPOCH).total_seconds()
@@ -6,7 +6,7 @@ from typing import Any, List
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, kw_only=True)
 class DomainEvent:
     """Base class for domain events."""
     aggregate_id: UUID
@@ -14,12 +14,14 @@ class DomainEvent:
     event_type: str = field(init=False)
     
     def __post_init__(self):
-        self.event_type = self.__class__.__name__
+        object.__setattr__(self, "event_type", type(self).__name__)
 
 
 class Entity(ABC):
     """Base class for all domain entities."""
     
+    __slots__ = ("_id", "_events")
+    
     def __init__(self, id: UUID = None):
         self._id = id or uuid4()
         self._events: List[DomainEvent] = []
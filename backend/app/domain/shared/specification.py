@@ -1,18 +1,52 @@
 """Specification pattern for domain queries."""
+import re
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Any, Dict, Generic, Optional, Tuple, TypeVar
 
 T = TypeVar('T')
 
+# SQL boolean expression plus its named bind parameters
+SqlPredicate = Tuple[str, Dict[str, Any]]
+
+# A ":name" bind parameter, matched the way sqlalchemy.text() finds them
+_BIND_PARAM = r"(?<![:\w]):{}(?![\w:])"
+
+
+def _rebind(sql: str, params: Dict[str, Any], bound: Dict[str, Any]) -> SqlPredicate:
+    """
+    Rename parameters that are already bound to a different value.
+    Names only change on a clash, so the same composition always yields the same SQL.
+    """
+    renamed: Dict[str, Any] = {}
+    for name, value in params.items():
+        if name in bound and bound[name] != value:
+            index = 1
+            while any(f"{name}_{index}" in names for names in (bound, params, renamed)):
+                index += 1
+            new_name = f"{name}_{index}"
+            sql = re.sub(_BIND_PARAM.format(re.escape(name)), f":{new_name}", sql)
+            name = new_name
+        renamed[name] = value
+    return sql, renamed
+
 
 class Specification(ABC, Generic[T]):
     """Base specification for domain queries."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def is_satisfied_by(self, candidate: T) -> bool:
         """Check if the specification is satisfied by the candidate."""
         pass
     
+    def to_sql(self) -> Optional[SqlPredicate]:
+        """
+        Translate the specification into a SQL predicate.
+        None means there is no translation and repositories filter with is_satisfied_by.
+        """
+        return None
+    
     def and_(self, other: 'Specification[T]') -> 'AndSpecification[T]':
         """Create an AND specification."""
         return AndSpecification(self, other)
@@ -24,35 +58,90 @@ class Specification(ABC, Generic[T]):
     def not_(self) -> 'NotSpecification[T]':
         """Create a NOT specification."""
         return NotSpecification(self)
+    
+    __and__ = and_
+    __or__ = or_
+    __invert__ = not_
+
+
+def _flatten(
+    cls: type,
+    left: Specification[T],
+    right: Specification[T]
+) -> Tuple[Specification[T], ...]:
+    """Inline nested composites of the same kind so chains evaluate in one loop."""
+    specs = []
+    for spec in (left, right):
+        if type(spec) is cls:
+            specs.extend(spec.specs)
+        else:
+            specs.append(spec)
+    return tuple(specs)
+
+
+def _join_sql(operator: str, specs: Tuple[Specification[T], ...]) -> Optional[SqlPredicate]:
+    clauses = []
+    params: Dict[str, Any] = {}
+    for spec in specs:
+        translated = spec.to_sql()
+        if translated is None:
+            return None
+        sql, spec_params = _rebind(*translated, params)
+        clauses.append(f"({sql})")
+        params.update(spec_params)
+    return f" {operator} ".join(clauses), params
 
 
 class AndSpecification(Specification[T]):
     """AND combination of specifications."""
     
+    __slots__ = ("specs",)
+    
     def __init__(self, left: Specification[T], right: Specification[T]):
-        self.left = left
-        self.right = right
+        self.specs = _flatten(AndSpecification, left, right)
     
     def is_satisfied_by(self, candidate: T) -> bool:
-        return self.left.is_satisfied_by(candidate) and self.right.is_satisfied_by(candidate)
+        for spec in self.specs:
+            if not spec.is_satisfied_by(candidate):
+                return False
+        return True
+    
+    def to_sql(self) -> Optional[SqlPredicate]:
+        return _join_sql("AND", self.specs)
 
 
 class OrSpecification(Specification[T]):
     """OR combination of specifications."""
     
+    __slots__ = ("specs",)
+    
     def __init__(self, left: Specification[T], right: Specification[T]):
-        self.left = left
-        self.right = right
+        self.specs = _flatten(OrSpecification, left, right)
     
     def is_satisfied_by(self, candidate: T) -> bool:
-        return self.left.is_satisfied_by(candidate) or self.right.is_satisfied_by(candidate)
+        for spec in self.specs:
+            if spec.is_satisfied_by(candidate):
+                return True
+        return False
+    
+    def to_sql(self) -> Optional[SqlPredicate]:
+        return _join_sql("OR", self.specs)
 
 
 class NotSpecification(Specification[T]):
     """NOT specification."""
     
+    __slots__ = ("spec",)
+    
     def __init__(self, spec: Specification[T]):
         self.spec = spec
     
     def is_satisfied_by(self, candidate: T) -> bool:
-        return not self.spec.is_satisfied_by(candidate)
\ No newline at end of file
+        return not self.spec.is_satisfied_by(candidate)
+    
+    def to_sql(self) -> Optional[SqlPredicate]:
+        translated = self.spec.to_sql()
+        if translated is None:
+            return None
+        sql, params = translated
+        return f"NOT ({sql})", params
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""Unit of Work for batching aggregate writes."""
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, List
+from uuid import UUID
+
+from app.domain.shared.aggregate_root import AggregateRoot
+
+
+CommitListener = Callable[[List[AggregateRoot]], Awaitable[None]]
+
+
+class UnitOfWork(ABC):
+    """
+    Collects aggregates changed during a request and persists them together.
+    Registering the same aggregate twice still results in a single write.
+    """
+    
+    def __init__(self):
+        self._pending: Dict[UUID, AggregateRoot] = {}
+        self._listeners: List[CommitListener] = []
+    
+    def on_commit(self, listener: CommitListener) -> None:
+        """Call listener with the written aggregates after each successful commit."""
+        self._listeners.append(listener)
+    
+    def register(self, aggregate: AggregateRoot) -> None:
+        """Mark an aggregate as changed."""
+        self._pending[aggregate.id] = aggregate
+    
+    async def commit(self) -> None:
+        """
+        Persist all registered aggregates in one transaction.
+        If the flush fails the transaction is rolled back and the aggregates
+        stay registered, so the caller can retry or discard them.
+        """
+        if not self._pending:
+            return
+        aggregates = list(self._pending.values())
+        try:
+            await self._flush(aggregates)
+        except Exception:
+            await self._rollback_transaction()
+            raise
+        self._pending.clear()
+        
+        for listener in self._listeners:
+            await listener(aggregates)
+    
+    async def rollback(self) -> None:
+        """Discard registered changes without persisting them."""
+        self._pending.clear()
+        await self._rollback_transaction()
+    
+    @abstractmethod
+    async def _flush(self, aggregates: List[AggregateRoot]) -> None:
+        """
+        Write aggregates, their pending domain events and dependent projections
+        in a single transaction using batched INSERT/UPDATE statements.
+        """
+        pass
+    
+    async def _rollback_transaction(self) -> None:
+        """Undo anything a failed flush wrote. Stores without transactions have nothing to undo."""
+        pass
+    
+    async def __aenter__(self) -> 'UnitOfWork':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
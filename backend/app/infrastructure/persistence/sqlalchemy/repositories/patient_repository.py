@@ -0,0 +1,361 @@
+"""SQLAlchemy implementation of the patient repository."""
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Text, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.patient.aggregate import Patient
+from app.domain.patient.repository import PatientRepository
+from app.domain.patient.value_objects import PhoneNumber, ABHANumber
+from app.domain.shared import clock
+from app.domain.shared.specification import Specification
+
+_PATIENT_COLUMNS = (
+    "patients.id, patients.phone, patients.email, patients.abha_number,"
+    " patients.first_name, patients.middle_name, patients.last_name,"
+    " patients.date_of_birth, patients.gender, patients.address,"
+    " patients.language_preference, patients.emergency_contacts, patients.medical_history,"
+    " patients.is_active, patients.is_verified, patients.created_at,"
+    " patients.verified_at, patients.last_activity_at, patients.version"
+)
+
+_INSERT_PATIENT = (
+    "INSERT INTO patients ("
+    "id, phone, email, abha_number, first_name, middle_name, last_name,"
+    " date_of_birth, gender, address, language_preference, emergency_contacts,"
+    " medical_history, is_active, is_verified, verified_at, last_activity_at,"
+    " active_consent_types, version, created_at, updated_at"
+    ") VALUES ("
+    ":id, :phone, :email, :abha_number, :first_name, :middle_name, :last_name,"
+    " :date_of_birth, :gender, :address, :language_preference, :emergency_contacts,"
+    " :medical_history, :is_active, :is_verified, :verified_at, :last_activity_at,"
+    " :active_consent_types, :version, :registered_at, now()"
+    ")"
+)
+
+_JSON_PARAMS = (
+    bindparam("address", type_=JSONB),
+    bindparam("emergency_contacts", type_=JSONB),
+    bindparam("medical_history", type_=JSONB),
+    bindparam("active_consent_types", type_=ARRAY(Text)),
+)
+
+# Never overwrite a row that already holds a newer version of the aggregate
+_UPSERT_PATIENT = text(
+    _INSERT_PATIENT
+    + " ON CONFLICT (id) DO UPDATE SET"
+    " phone = EXCLUDED.phone, email = EXCLUDED.email, abha_number = EXCLUDED.abha_number,"
+    " first_name = EXCLUDED.first_name, middle_name = EXCLUDED.middle_name,"
+    " last_name = EXCLUDED.last_name, date_of_birth = EXCLUDED.date_of_birth,"
+    " gender = EXCLUDED.gender, address = EXCLUDED.address,"
+    " language_preference = EXCLUDED.language_preference,"
+    " emergency_contacts = EXCLUDED.emergency_contacts,"
+    " medical_history = EXCLUDED.medical_history, is_active = EXCLUDED.is_active,"
+    " is_verified = EXCLUDED.is_verified, verified_at = EXCLUDED.verified_at,"
+    " last_activity_at = EXCLUDED.last_activity_at,"
+    " active_consent_types = EXCLUDED.active_consent_types,"
+    " version = EXCLUDED.version, updated_at = now()"
+    " WHERE patients.version <= EXCLUDED.version"
+).bindparams(*_JSON_PARAMS)
+
+_INSERT_PATIENT_IF_NEW = text(
+    _INSERT_PATIENT + " ON CONFLICT DO NOTHING RETURNING id"
+).bindparams(*_JSON_PARAMS)
+
+_UPSERT_CONSENT = text(
+    "INSERT INTO consents ("
+    "id, patient_id, consent_type, purpose, granted_at, expires_at, revoked_at"
+    ") VALUES ("
+    ":id, :patient_id, :consent_type, :purpose, :granted_at, :expires_at, :revoked_at"
+    ") ON CONFLICT (id) DO UPDATE SET"
+    " expires_at = EXCLUDED.expires_at, revoked_at = EXCLUDED.revoked_at"
+)
+
+_SELECT_CONSENTS = text(
+    "SELECT consents.id, consents.patient_id, consents.consent_type, consents.purpose,"
+    " consents.granted_at, consents.expires_at, consents.revoked_at"
+    " FROM consents WHERE consents.patient_id = ANY(:patient_ids)"
+    " ORDER BY consents.granted_at"
+)
+
+# Served by ix_consents_expires_at_unrevoked
+_SELECT_CONSENTS_EXPIRING = text(
+    "SELECT DISTINCT consents.patient_id FROM consents"
+    " WHERE consents.revoked_at IS NULL"
+    " AND consents.expires_at >= :now AND consents.expires_at <= :threshold"
+)
+
+_SELECT_VERSIONS = text(
+    "SELECT patients.id, patients.version FROM patients WHERE patients.id = ANY(:patient_ids)"
+)
+
+_SOFT_DELETE = text(
+    "UPDATE patients SET is_active = FALSE, updated_at = now() WHERE patients.id = :patient_id"
+)
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _to_snapshot(row: Any, consent_rows: Iterable[Any]) -> Dict[str, Any]:
+    """Build Patient.to_snapshot()-shaped data from a patients row and its consents."""
+    consents = []
+    # Latest unrevoked consent per type, as Patient.grant_consent indexes them
+    indexed: Dict[str, str] = {}
+    for consent in consent_rows:
+        consent_id = str(consent.id)
+        consents.append({
+            "id": consent_id,
+            "consent_type": consent.consent_type,
+            "purpose": consent.purpose,
+            "granted_at": _iso(consent.granted_at),
+            "expires_at": _iso(consent.expires_at),
+            "revoked_at": _iso(consent.revoked_at),
+        })
+        if consent.revoked_at is None:
+            indexed[consent.consent_type] = consent_id
+    
+    contacts = row.emergency_contacts or []
+    return {
+        "id": str(row.id),
+        "version": row.version,
+        "phone": {"number": row.phone},
+        "name": {
+            "first_name": row.first_name,
+            "last_name": row.last_name,
+            "middle_name": row.middle_name,
+        },
+        "date_of_birth": row.date_of_birth.isoformat(),
+        # Rows written by the API may have no gender
+        "gender": row.gender or "prefer_not_to_say",
+        "email": row.email,
+        "abha_number": row.abha_number,
+        "address": row.address,
+        "language_preference": row.language_preference or "en",
+        "consents": consents,
+        "indexed_consent_ids": list(indexed.values()),
+        "emergency_contacts": contacts,
+        "primary_contact_id": next(
+            (contact["id"] for contact in contacts if contact["is_primary"]), None
+        ),
+        "medical_history": row.medical_history or {},
+        "is_verified": row.is_verified,
+        "is_active": row.is_active,
+        "registered_at": _iso(row.created_at),
+        "verified_at": _iso(row.verified_at),
+        "last_activity_at": _iso(row.last_activity_at or row.created_at),
+    }
+
+
+def _patient_params(patient: Patient) -> Dict[str, Any]:
+    snapshot = patient.to_snapshot()
+    return {
+        "id": patient.id,
+        "phone": patient.phone.number,
+        "email": snapshot["email"],
+        "abha_number": snapshot["abha_number"],
+        "first_name": patient.name.first_name,
+        "middle_name": patient.name.middle_name,
+        "last_name": patient.name.last_name,
+        "date_of_birth": patient.date_of_birth.value,
+        "gender": patient.gender.value,
+        "address": asdict(patient.address) if patient.address else None,
+        "language_preference": patient.language_preference,
+        "emergency_contacts": snapshot["emergency_contacts"],
+        "medical_history": snapshot["medical_history"],
+        "is_active": patient.is_active,
+        "is_verified": patient.is_verified,
+        "verified_at": patient.verified_at,
+        "last_activity_at": patient.last_activity_at,
+        "active_consent_types": sorted(patient.active_consent_types),
+        "version": patient.version,
+        "registered_at": patient.registered_at,
+    }
+
+
+def _consent_params(patients: Iterable[Patient]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": consent.id,
+            "patient_id": patient.id,
+            "consent_type": consent.consent_type,
+            "purpose": consent.purpose,
+            "granted_at": consent.granted_at,
+            "expires_at": consent.expires_at,
+            "revoked_at": consent.revoked_at,
+        }
+        for patient in patients
+        for consent in patient.consents
+    ]
+
+
+class SqlAlchemyPatientRepository(PatientRepository):
+    """
+    Patient repository over the patients and consents tables.
+    Writes are not committed here; the session owner (get_db or a unit of work) commits.
+    """
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def _find_where(
+        self,
+        predicate: str,
+        params: Dict[str, Any],
+        order_by: str = "patients.created_at, patients.id",
+        limit: Optional[int] = None
+    ) -> List[Patient]:
+        sql = f"SELECT {_PATIENT_COLUMNS} FROM patients WHERE {predicate} ORDER BY {order_by}"
+        if limit is not None:
+            sql += f" LIMIT {limit:d}"
+        result = await self.session.execute(text(sql), params)
+        rows = result.all()
+        if not rows:
+            return []
+        
+        # One consents query for the whole page instead of one per patient
+        consents: Dict[UUID, List[Any]] = {row.id: [] for row in rows}
+        result = await self.session.execute(
+            _SELECT_CONSENTS, {"patient_ids": list(consents)}
+        )
+        for consent in result:
+            consents[consent.patient_id].append(consent)
+        
+        return [Patient.from_snapshot(_to_snapshot(row, consents[row.id])) for row in rows]
+    
+    async def _find_one(
+        self,
+        predicate: str,
+        params: Dict[str, Any],
+        order_by: str = "patients.id"
+    ) -> Optional[Patient]:
+        patients = await self._find_where(predicate, params, order_by=order_by, limit=1)
+        return patients[0] if patients else None
+    
+    async def _exists(self, predicate: str, params: Dict[str, Any]) -> bool:
+        result = await self.session.execute(
+            text(f"SELECT EXISTS (SELECT 1 FROM patients WHERE {predicate})"), params
+        )
+        return result.scalar_one()
+    
+    async def find_by_id(self, patient_id: UUID) -> Optional[Patient]:
+        return await self._find_one("patients.id = :patient_id", {"patient_id": patient_id})
+    
+    async def find_by_phone(self, phone: PhoneNumber) -> Optional[Patient]:
+        return await self._find_one("patients.phone = :phone", {"phone": phone.number})
+    
+    async def find_by_abha(self, abha: ABHANumber) -> Optional[Patient]:
+        return await self._find_one("patients.abha_number = :abha", {"abha": abha.value})
+    
+    async def find_by_phone_or_abha(
+        self,
+        phone: PhoneNumber,
+        abha: Optional[ABHANumber] = None
+    ) -> Optional[Patient]:
+        if abha is None:
+            return await self.find_by_phone(phone)
+        # A phone match wins over an ABHA match, as in the two-query default
+        return await self._find_one(
+            "patients.phone = :phone OR patients.abha_number = :abha",
+            {"phone": phone.number, "abha": abha.value},
+            order_by="patients.phone = :phone DESC",
+        )
+    
+    async def find_by_specification(
+        self,
+        specification: Specification[Patient]
+    ) -> List[Patient]:
+        translated = specification.to_sql()
+        if translated is None:
+            return [
+                patient for patient in await self._find_where("TRUE", {})
+                if specification.is_satisfied_by(patient)
+            ]
+        return await self._find_where(*translated)
+    
+    async def find_ids_by_specification(
+        self,
+        specification: Specification[Patient]
+    ) -> List[UUID]:
+        translated = specification.to_sql()
+        if translated is None:
+            return await super().find_ids_by_specification(specification)
+        
+        predicate, params = translated
+        result = await self.session.execute(
+            text(f"SELECT patients.id FROM patients WHERE {predicate} ORDER BY patients.id"),
+            params,
+        )
+        return list(result.scalars())
+    
+    async def find_patients_needing_consent_renewal(
+        self,
+        days_before_expiry: int
+    ) -> List[UUID]:
+        now = clock.now()
+        result = await self.session.execute(
+            _SELECT_CONSENTS_EXPIRING,
+            {"now": now, "threshold": now + timedelta(days=days_before_expiry)},
+        )
+        return list(result.scalars())
+    
+    async def stage(self, patients: Sequence[Patient]) -> None:
+        """
+        Upsert patients and their consents in the current transaction with
+        batched statements. Raises ValueError if a stored row is newer.
+        """
+        if not patients:
+            return
+        
+        await self.session.execute(_UPSERT_PATIENT, [_patient_params(p) for p in patients])
+        consent_params = _consent_params(patients)
+        if consent_params:
+            await self.session.execute(_UPSERT_CONSENT, consent_params)
+        
+        result = await self.session.execute(
+            _SELECT_VERSIONS, {"patient_ids": [patient.id for patient in patients]}
+        )
+        stored = dict(result.all())
+        for patient in patients:
+            if stored.get(patient.id) != patient.version:
+                raise ValueError(f"Patient {patient.id} was modified concurrently")
+    
+    async def save(self, patient: Patient) -> None:
+        await self.stage([patient])
+    
+    async def save_if_new(self, patient: Patient) -> bool:
+        result = await self.session.execute(_INSERT_PATIENT_IF_NEW, _patient_params(patient))
+        if result.scalar_one_or_none() is None:
+            return False
+        
+        consent_params = _consent_params([patient])
+        if consent_params:
+            await self.session.execute(_UPSERT_CONSENT, consent_params)
+        return True
+    
+    async def update(self, patient: Patient) -> None:
+        await self.stage([patient])
+    
+    async def delete(self, patient_id: UUID) -> None:
+        await self.session.execute(_SOFT_DELETE, {"patient_id": patient_id})
+    
+    async def exists_by_phone(self, phone: PhoneNumber) -> bool:
+        return await self._exists("patients.phone = :phone", {"phone": phone.number})
+    
+    async def exists_by_abha(self, abha: ABHANumber) -> bool:
+        return await self._exists("patients.abha_number = :abha", {"abha": abha.value})
+    
+    async def count(self) -> int:
+        result = await self.session.execute(text("SELECT count(*) FROM patients"))
+        return result.scalar_one()
+    
+    async def count_active(self) -> int:
+        result = await self.session.execute(
+            text("SELECT count(*) FROM patients WHERE patients.is_active IS TRUE")
+        )
+        return result.scalar_one()
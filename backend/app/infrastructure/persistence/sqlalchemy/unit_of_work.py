@@ -0,0 +1,38 @@
+"""SQLAlchemy-backed Unit of Work."""
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.patient.aggregate import Patient
+from app.domain.shared.aggregate_root import AggregateRoot
+from app.domain.shared.unit_of_work import UnitOfWork
+from app.infrastructure.persistence.sqlalchemy.repositories.patient_repository import (
+    SqlAlchemyPatientRepository
+)
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork):
+    """
+    Writes registered aggregates through the session with batched upserts
+    and commits them as one transaction.
+    """
+    
+    def __init__(
+        self,
+        session: AsyncSession,
+        patients: Optional[SqlAlchemyPatientRepository] = None
+    ):
+        super().__init__()
+        self.session = session
+        self.patients = patients or SqlAlchemyPatientRepository(session)
+    
+    async def _flush(self, aggregates: List[AggregateRoot]) -> None:
+        for aggregate in aggregates:
+            if not isinstance(aggregate, Patient):
+                raise TypeError(f"No repository for {type(aggregate).__name__} aggregates")
+        
+        await self.patients.stage(aggregates)
+        await self.session.commit()
+    
+    async def _rollback_transaction(self) -> None:
+        await self.session.rollback()
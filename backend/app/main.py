@@ -2,6 +2,7 @@ from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
@@ -9,12 +10,16 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.api import router as api_router
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.core.cache import close_cache
 from app.core.config import settings
 from app.core.database import engine
 from app.core.logging import setup_logging
 from app.middleware.audit import AuditMiddleware
 from app.middleware.security import SecurityHeadersMiddleware
 from app.models import Base
+from app.services.audit import audit_writer
+from app.services.notification import notification_service
 
 
 @asynccontextmanager
@@ -24,8 +29,13 @@ async def lifespan(app: FastAPI) -> Any:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
+    audit_writer.start()
+    
     yield
     
+    await audit_writer.stop()
+    notification_service.close()
+    await close_cache()
     await engine.dispose()
 
 
@@ -37,6 +47,7 @@ def create_application() -> FastAPI:
         docs_url="/docs" if not settings.PRODUCTION else None,
         redoc_url="/redoc" if not settings.PRODUCTION else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
     app.add_middleware(
@@ -45,9 +56,12 @@ def create_application() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Browsers hide non-safelisted response headers from scripts unless exposed
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
     
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    if settings.GZIP_ENABLED:
+        app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MINIMUM_SIZE)
     
     app.add_middleware(
         TrustedHostMiddleware,
@@ -1,75 +1,80 @@
-import uuid
-import json
+import secrets
+import time
 from datetime import datetime
-from typing import Optional
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging import get_logger
 from app.services.audit import AuditService
 
 logger = get_logger(__name__)
 
+_EXCLUDED_PATH_PREFIXES = ("/health", "/metrics", "/docs", "/openapi.json", "/redoc")
+_PHI_PATH_PREFIXES = tuple(
+    f"/api/v1{p}"
+    for p in ("/patients", "/encounters", "/appointments", "/intake", "/emr")
+)
 
-class AuditMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:
-        trace_id = str(uuid.uuid4())
-        request.state.trace_id = trace_id
+
+class AuditMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        trace_id = secrets.token_hex(16)
+        scope.setdefault("state", {})["trace_id"] = trace_id
+        request = Request(scope)
         
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
         
-        request_body = None
-        if request.method in ["POST", "PUT", "PATCH"]:
-            try:
-                body = await request.body()
-                if body:
-                    request_body = body.decode("utf-8")
-                    request._body = body
-            except Exception:
-                pass
+        should_audit = self._should_audit(request.url.path)
+        status_code = 500
         
-        response = await call_next(request)
+        async def send_with_trace_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Trace-Id", trace_id)
+            await send(message)
         
-        end_time = datetime.utcnow()
-        duration_ms = (end_time - start_time).total_seconds() * 1000
+        await self.app(scope, receive, send_with_trace_id)
         
-        if self._should_audit(request.url.path):
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        
+        if should_audit:
             await self._create_audit_log(
                 request=request,
-                response=response,
+                status_code=status_code,
                 trace_id=trace_id,
                 duration_ms=duration_ms,
-                request_body=request_body,
             )
-        
-        response.headers["X-Trace-Id"] = trace_id
-        
-        return response
     
     def _should_audit(self, path: str) -> bool:
-        excluded_paths = ["/health", "/metrics", "/docs", "/openapi.json", "/redoc"]
-        return not any(path.startswith(p) for p in excluded_paths)
+        return not path.startswith(_EXCLUDED_PATH_PREFIXES)
     
     async def _create_audit_log(
         self,
         request: Request,
-        response: Response,
+        status_code: int,
         trace_id: str,
         duration_ms: float,
-        request_body: Optional[str] = None,
     ) -> None:
         try:
             phi_accessed = self._check_phi_access(request.url.path)
             
             audit_data = {
                 "trace_id": trace_id,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.utcnow(),
                 "method": request.method,
                 "path": request.url.path,
                 "query_params": dict(request.query_params),
-                "status_code": response.status_code,
+                "status_code": status_code,
                 "duration_ms": duration_ms,
                 "ip_address": request.client.host if request.client else "unknown",
                 "user_agent": request.headers.get("user-agent"),
@@ -86,11 +91,4 @@ class AuditMiddleware(BaseHTTPMiddleware):
             logger.error("Failed to create audit log", error=str(e), trace_id=trace_id)
     
     def _check_phi_access(self, path: str) -> bool:
-        phi_paths = [
-            "/patients",
-            "/encounters",
-            "/appointments",
-            "/intake",
-            "/emr",
-        ]
-        return any(path.startswith(f"/api/v1{p}") for p in phi_paths)
\ No newline at end of file
+        return path.startswith(_PHI_PATH_PREFIXES)
\ No newline at end of file
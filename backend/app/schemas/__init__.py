@@ -1,65 +1,89 @@
-from app.schemas.patient import (
-    PatientCreate,
-    PatientUpdate,
-    PatientResponse,
-    PatientInDB,
-)
-from app.schemas.provider import (
-    ProviderCreate,
-    ProviderUpdate,
-    ProviderResponse,
-    ProviderInDB,
-)
-from app.schemas.appointment import (
-    AppointmentCreate,
-    AppointmentUpdate,
-    AppointmentResponse,
-    AppointmentSlot,
-)
-from app.schemas.encounter import (
-    EncounterCreate,
-    EncounterUpdate,
-    EncounterResponse,
-    IntakeSummary,
-)
-from app.schemas.auth import (
-    Token,
-    TokenData,
-    LoginRequest,
-    OTPRequest,
-    OTPVerify,
-)
-from app.schemas.intake import (
-    IntakeSession,
-    ConversationTurn,
-    RedFlag,
-    IntakeCompletion,
-)
+"""API schemas.
 
-__all__ = [
-    "PatientCreate",
-    "PatientUpdate",
-    "PatientResponse",
-    "PatientInDB",
-    "ProviderCreate",
-    "ProviderUpdate",
-    "ProviderResponse",
-    "ProviderInDB",
-    "AppointmentCreate",
-    "AppointmentUpdate",
-    "AppointmentResponse",
-    "AppointmentSlot",
-    "EncounterCreate",
-    "EncounterUpdate",
-    "EncounterResponse",
-    "IntakeSummary",
-    "Token",
-    "TokenData",
-    "LoginRequest",
-    "OTPRequest",
-    "OTPVerify",
-    "IntakeSession",
-    "ConversationTurn",
-    "RedFlag",
-    "IntakeCompletion",
-]
\ No newline at end of file
+Submodules are imported on first attribute access (PEP 562) so a worker only
+builds the Pydantic models it actually uses.
+"""
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.schemas.patient import (
+        PatientCreate,
+        PatientUpdate,
+        PatientResponse,
+        PatientInDB,
+    )
+    from app.schemas.provider import (
+        ProviderCreate,
+        ProviderUpdate,
+        ProviderResponse,
+        ProviderInDB,
+    )
+    from app.schemas.appointment import (
+        AppointmentCreate,
+        AppointmentUpdate,
+        AppointmentResponse,
+        AppointmentSlot,
+    )
+    from app.schemas.encounter import (
+        EncounterCreate,
+        EncounterUpdate,
+        EncounterResponse,
+        IntakeSummary,
+    )
+    from app.schemas.auth import (
+        Token,
+        TokenData,
+        LoginRequest,
+        OTPRequest,
+        OTPVerify,
+    )
+    from app.schemas.intake import (
+        IntakeSession,
+        ConversationTurn,
+        RedFlag,
+        IntakeCompletion,
+    )
+
+_EXPORTS = {
+    "PatientCreate": "app.schemas.patient",
+    "PatientUpdate": "app.schemas.patient",
+    "PatientResponse": "app.schemas.patient",
+    "PatientInDB": "app.schemas.patient",
+    "ProviderCreate": "app.schemas.provider",
+    "ProviderUpdate": "app.schemas.provider",
+    "ProviderResponse": "app.schemas.provider",
+    "ProviderInDB": "app.schemas.provider",
+    "AppointmentCreate": "app.schemas.appointment",
+    "AppointmentUpdate": "app.schemas.appointment",
+    "AppointmentResponse": "app.schemas.appointment",
+    "AppointmentSlot": "app.schemas.appointment",
+    "EncounterCreate": "app.schemas.encounter",
+    "EncounterUpdate": "app.schemas.encounter",
+    "EncounterResponse": "app.schemas.encounter",
+    "IntakeSummary": "app.schemas.encounter",
+    "Token": "app.schemas.auth",
+    "TokenData": "app.schemas.auth",
+    "LoginRequest": "app.schemas.auth",
+    "OTPRequest": "app.schemas.auth",
+    "OTPVerify": "app.schemas.auth",
+    "IntakeSession": "app.schemas.intake",
+    "ConversationTurn": "app.schemas.intake",
+    "RedFlag": "app.schemas.intake",
+    "IntakeCompletion": "app.schemas.intake",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_EXPORTS))
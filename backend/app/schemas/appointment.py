@@ -1,14 +1,14 @@
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Optional, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class AppointmentBase(BaseModel):
     patient_id: UUID
     provider_id: UUID
-    appointment_type: str = Field(default="physical", pattern="^(physical|virtual)$")
+    appointment_type: Literal["physical", "virtual"] = "physical"
     scheduled_at: datetime
     duration_minutes: int = Field(default=30, ge=15, le=120)
     reason: Optional[str] = Field(None, max_length=500)
@@ -17,7 +17,9 @@ class AppointmentBase(BaseModel):
     @field_validator("scheduled_at")
     @classmethod
     def validate_scheduled_at(cls, v: datetime) -> datetime:
-        if v < datetime.utcnow():
+        # Naive values are UTC, matching how timestamps are stored
+        aware = v if v.tzinfo is not None else v.replace(tzinfo=timezone.utc)
+        if aware < datetime.now(timezone.utc):
             raise ValueError("Appointment cannot be scheduled in the past")
         return v
 
@@ -29,7 +31,7 @@ class AppointmentCreate(AppointmentBase):
 class AppointmentUpdate(BaseModel):
     scheduled_at: Optional[datetime] = None
     duration_minutes: Optional[int] = Field(None, ge=15, le=120)
-    status: Optional[str] = Field(None, pattern="^(scheduled|confirmed|cancelled|completed)$")
+    status: Optional[Literal["scheduled", "confirmed", "cancelled", "completed"]] = None
     reason: Optional[str] = Field(None, max_length=500)
     notes: Optional[str] = Field(None, max_length=1000)
     cancellation_reason: Optional[str] = Field(None, max_length=500)
@@ -50,8 +52,7 @@ class AppointmentResponse(AppointmentBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AppointmentSlot(BaseModel):
@@ -61,4 +62,4 @@ class AppointmentSlot(BaseModel):
     end_time: datetime
     duration_minutes: int
     available: bool
-    appointment_type: str = Field(pattern="^(physical|virtual|both)$")
\ No newline at end of file
+    appointment_type: Literal["physical", "virtual", "both"]
\ No newline at end of file
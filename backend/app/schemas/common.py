@@ -0,0 +1,12 @@
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+# Constraints are enforced by pydantic-core, so models sharing these types
+# need no Python-level field validators.
+PhoneStr = Annotated[
+    str,
+    StringConstraints(min_length=10, max_length=15, pattern=r"^[+]?[0-9]{10,15}$"),
+]
+
+LanguageCode = Annotated[str, StringConstraints(pattern=r"^[a-z]{2}$")]
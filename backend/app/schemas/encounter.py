@@ -1,8 +1,8 @@
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class HistoryPresentIllness(BaseModel):
@@ -29,7 +29,7 @@ class Medication(BaseModel):
 class Allergy(BaseModel):
     allergen: str
     reaction: str
-    severity: str = Field(pattern="^(mild|moderate|severe)$")
+    severity: Literal["mild", "moderate", "severe"]
     onset_date: Optional[datetime] = None
 
 
@@ -75,7 +75,7 @@ class EncounterUpdate(BaseModel):
     clinical_notes: Optional[str] = None
     diagnosis: Optional[str] = None
     treatment_plan: Optional[str] = None
-    status: Optional[str] = Field(None, pattern="^(draft|in_progress|completed|signed)$")
+    status: Optional[Literal["draft", "in_progress", "completed", "signed"]] = None
 
 
 class EncounterResponse(EncounterBase):
@@ -86,5 +86,4 @@ class EncounterResponse(EncounterBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from uuid import UUID
 from enum import Enum
 
@@ -51,7 +51,7 @@ class IntakeSession(BaseModel):
     conversation_turns: List[ConversationTurn] = []
     collected_data: Dict[str, Any] = {}
     red_flags: List[RedFlag] = []
-    session_status: str = Field(pattern="^(active|paused|completed|escalated|abandoned)$")
+    session_status: Literal["active", "paused", "completed", "escalated", "abandoned"]
     started_at: datetime
     last_activity_at: datetime
     completed_at: Optional[datetime] = None
@@ -77,7 +77,7 @@ class IntakeCompletion(BaseModel):
 
 class WebSocketMessage(BaseModel):
     type: str
-    data: Any
+    data: Any = None
     sequence: Optional[int] = None
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
@@ -2,13 +2,23 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
-import re
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+import string
+
+from app.schemas.common import PhoneStr
+
+# Required password character classes, checked against the set of characters in one pass
+_PASSWORD_CHARACTER_CLASSES = (
+    ("one uppercase letter", frozenset(string.ascii_uppercase)),
+    ("one lowercase letter", frozenset(string.ascii_lowercase)),
+    ("one number", frozenset(string.digits)),
+    ("one special character", frozenset('!@#$%^&*(),.?":{}|<>')),
+)
 
 
 class ProviderBase(BaseModel):
     email: EmailStr
-    phone: str = Field(..., min_length=10, max_length=15)
+    phone: PhoneStr
     first_name: str = Field(..., min_length=1, max_length=100)
     last_name: str = Field(..., min_length=1, max_length=100)
     registration_number: str = Field(..., min_length=1, max_length=50)
@@ -17,14 +27,6 @@ class ProviderBase(BaseModel):
     working_hours: Optional[Dict[str, Any]] = None
     consultation_fee: Optional[int] = Field(None, ge=0)
     
-    @field_validator("phone")
-    @classmethod
-    def validate_phone(cls, v: str) -> str:
-        phone_regex = r"^[+]?[0-9]{10,15}$"
-        if not re.match(phone_regex, v):
-            raise ValueError("Invalid phone number format")
-        return v
-    
     @field_validator("specialization")
     @classmethod
     def validate_specialization(cls, v: str) -> str:
@@ -40,22 +42,19 @@ class ProviderCreate(ProviderBase):
     @field_validator("password")
     @classmethod
     def validate_password(cls, v: str) -> str:
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one number")
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", v):
-            raise ValueError("Password must contain at least one special character")
+        chars = set(v)
+        missing = [
+            name for name, allowed in _PASSWORD_CHARACTER_CLASSES
+            if chars.isdisjoint(allowed)
+        ]
+        if missing:
+            raise ValueError("Password must contain at least " + ", ".join(missing))
         return v
 
 
 class ProviderUpdate(BaseModel):
     email: Optional[EmailStr] = None
-    phone: Optional[str] = Field(None, min_length=10, max_length=15)
+    phone: Optional[PhoneStr] = None
     first_name: Optional[str] = Field(None, min_length=1, max_length=100)
     last_name: Optional[str] = Field(None, min_length=1, max_length=100)
     qualifications: Optional[List[str]] = None
@@ -72,8 +71,7 @@ class ProviderResponse(ProviderBase):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ProviderInDB(ProviderResponse):
@@ -1,3 +1,5 @@
+import re
+import time
 from typing import Dict, Any, Optional
 from uuid import UUID
 from datetime import datetime
@@ -5,35 +7,104 @@ from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 import openai
 
+from app.core import cache
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.schemas.intake import IntakeSession, IntakeCompletion, RedFlag
 
 logger = get_logger(__name__)
 
+# Sessions live in Redis (encrypted, like other cached PHI) so any worker can
+# serve any turn; idle sessions expire with the intake timeout.
+INTAKE_SESSION_CACHE_RESOURCE = "intake_session"
+INTAKE_SESSION_TTL_SECONDS = settings.INTAKE_TIMEOUT_MINUTES * 60
+# In-instance copies go stale once another worker writes the session
+INTAKE_SESSION_LOCAL_TTL_SECONDS = 5
+
+_DANGEROUS_PATTERNS = (
+    "what's my diagnosis",
+    "am i going to die",
+    "what disease do i have",
+    "prescribe medication",
+    "do i have cancer",
+    "what medication",
+    "diagnosis",
+)
+
+_RED_FLAG_PATTERNS = {
+    "can't feel my legs": ("critical", "Possible cauda equina syndrome"),
+    "severe chest pain": ("critical", "Possible cardiac emergency"),
+    "difficulty breathing": ("critical", "Respiratory distress"),
+    "severe bleeding": ("critical", "Hemorrhage"),
+}
+
+# One alternation per pattern list, so each message is scanned once
+_SAFETY_RE = re.compile("|".join(re.escape(p) for p in _DANGEROUS_PATTERNS), re.IGNORECASE)
+
+# Named groups map a match back to its entry in _RED_FLAG_PATTERNS
+_RED_FLAG_GROUPS = {f"flag{i}": pattern for i, pattern in enumerate(_RED_FLAG_PATTERNS)}
+_RED_FLAG_RE = re.compile(
+    "|".join(f"(?P<{group}>{re.escape(pattern)})" for group, pattern in _RED_FLAG_GROUPS.items()),
+    re.IGNORECASE,
+)
+
 
 class AIIntakeService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        # Sessions already loaded by this instance, e.g. across websocket turns
         self.sessions: Dict[str, IntakeSession] = {}
+        self._session_expiry: Dict[str, float] = {}
+    
+    async def _load_session(self, session_id: str) -> Optional[IntakeSession]:
+        session = self.sessions.get(session_id)
+        if session is not None:
+            if time.monotonic() < self._session_expiry[session_id]:
+                return session
+            del self.sessions[session_id]
+        
+        try:
+            key = UUID(session_id)
+        except ValueError:
+            return None
+        
+        session = await cache.get_cached(INTAKE_SESSION_CACHE_RESOURCE, key, IntakeSession)
+        if session is not None:
+            self._remember(session)
+        return session
+    
+    def _remember(self, session: IntakeSession) -> None:
+        session_id = str(session.session_id)
+        self.sessions[session_id] = session
+        self._session_expiry[session_id] = time.monotonic() + INTAKE_SESSION_LOCAL_TTL_SECONDS
+    
+    async def _save_session(self, session: IntakeSession) -> None:
+        self._remember(session)
+        await cache.set_cached(
+            INTAKE_SESSION_CACHE_RESOURCE,
+            session.session_id,
+            session,
+            ttl_seconds=INTAKE_SESSION_TTL_SECONDS,
+        )
     
     async def create_session(
         self,
         session_id: str,
         appointment_id: UUID,
     ) -> IntakeSession:
+        now = datetime.utcnow()
         session = IntakeSession(
             session_id=UUID(session_id),
             patient_id=UUID("00000000-0000-0000-0000-000000000000"),  
             appointment_id=appointment_id,
             conversation_type="text",
             session_status="active",
-            started_at=datetime.utcnow(),
-            last_activity_at=datetime.utcnow(),
+            started_at=now,
+            last_activity_at=now,
         )
         
-        self.sessions[session_id] = session
+        await self._save_session(session)
         
         logger.info(f"Created intake session {session_id}")
         
@@ -45,14 +116,14 @@ class AIIntakeService:
         text: str,
         language: Optional[str] = None,
     ) -> Dict[str, Any]:
-        session = self.sessions.get(session_id)
+        session = await self._load_session(session_id)
         if not session:
             return {
                 "type": "error",
                 "message": "Session not found",
             }
         
-        safety_check = await self._check_safety(text)
+        safety_check = self._check_safety(text)
         if safety_check == "blocked":
             return {
                 "type": "ai_response",
@@ -61,9 +132,10 @@ class AIIntakeService:
                 "confidence": 1.0,
             }
         
-        red_flags = await self._detect_red_flags(text)
+        red_flags = self._detect_red_flags(text)
         if red_flags:
             session.red_flags.extend(red_flags)
+            await self._save_session(session)
             return {
                 "type": "red_flag_alert",
                 "message": "Please seek immediate medical attention",
@@ -74,6 +146,7 @@ class AIIntakeService:
         response = await self._generate_response(text, session)
         
         session.last_activity_at = datetime.utcnow()
+        await self._save_session(session)
         
         return {
             "type": "ai_response",
@@ -82,42 +155,29 @@ class AIIntakeService:
             "confidence": 0.95,
         }
     
-    async def _check_safety(self, text: str) -> str:
-        dangerous_patterns = [
-            "what's my diagnosis",
-            "am i going to die",
-            "what disease do i have",
-            "prescribe medication",
-            "do i have cancer",
-            "what medication",
-            "diagnosis",
-        ]
-        
-        text_lower = text.lower()
-        for pattern in dangerous_patterns:
-            if pattern in text_lower:
-                return "blocked"
+    @staticmethod
+    def _check_safety(text: str) -> str:
+        if _SAFETY_RE.search(text):
+            return "blocked"
         
         return "safe"
     
-    async def _detect_red_flags(self, text: str) -> list[RedFlag]:
-        red_flag_patterns = {
-            "can't feel my legs": ("critical", "Possible cauda equina syndrome"),
-            "severe chest pain": ("critical", "Possible cardiac emergency"),
-            "difficulty breathing": ("critical", "Respiratory distress"),
-            "severe bleeding": ("critical", "Hemorrhage"),
-        }
+    @staticmethod
+    def _detect_red_flags(text: str) -> list[RedFlag]:
+        matched = {_RED_FLAG_GROUPS[m.lastgroup] for m in _RED_FLAG_RE.finditer(text)}
+        if not matched:
+            return []
         
-        text_lower = text.lower()
+        detected_at = datetime.utcnow()
         red_flags = []
         
-        for pattern, (severity, condition) in red_flag_patterns.items():
-            if pattern in text_lower:
+        for pattern, (severity, condition) in _RED_FLAG_PATTERNS.items():
+            if pattern in matched:
                 red_flags.append(
                     RedFlag(
                         condition=condition,
                         severity=severity,
-                        detected_at=datetime.utcnow(),
+                        detected_at=detected_at,
                         context=text,
                         escalation_triggered=True,
                     )
@@ -152,12 +212,13 @@ class AIIntakeService:
             return "I understand. Could you tell me more about your symptoms?"
     
     async def complete_session(self, session_id: str) -> IntakeCompletion:
-        session = self.sessions.get(session_id)
+        session = await self._load_session(session_id)
         if not session:
             raise ValueError("Session not found")
         
         session.completed_at = datetime.utcnow()
         session.session_status = "completed"
+        await self._save_session(session)
         
         completion = IntakeCompletion(
             session_id=session.session_id,
@@ -180,7 +241,7 @@ class AIIntakeService:
         return completion
     
     async def get_session_status(self, session_id: str) -> Optional[Dict[str, Any]]:
-        session = self.sessions.get(session_id)
+        session = await self._load_session(session_id)
         if not session:
             return None
         
@@ -1,14 +1,164 @@
-from datetime import datetime
-from typing import Optional, Dict, Any
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import AuditLog
+from app.core.database import AsyncSessionLocal
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+AUDIT_BATCH_SIZE = 500
+AUDIT_FLUSH_INTERVAL_SECONDS = 0.5
+AUDIT_QUEUE_MAXSIZE = 10_000
+AUDIT_WRITE_ATTEMPTS = 3
+AUDIT_RETRY_BACKOFF_SECONDS = 0.2
+
+def build_audit_record(
+    actor_id: UUID,
+    actor_type: str,
+    action: str,
+    resource_type: str,
+    resource_id: UUID,
+    ip_address: str,
+    success: bool = True,
+    details: Optional[Dict[str, Any]] = None,
+    error_message: Optional[str] = None,
+    phi_accessed: bool = False,
+    trace_id: Optional[str] = None,
+    user_agent: Optional[str] = None,
+) -> Dict[str, Any]:
+    # One clock read for both the id and the (naive UTC) timestamp column
+    now_ns = time.time_ns()
+    return {
+        "event_id": f"{action}_{resource_type}_{now_ns}",
+        "timestamp": datetime.fromtimestamp(now_ns / 1e9, tz=timezone.utc).replace(tzinfo=None),
+        "actor_id": actor_id,
+        "actor_type": actor_type,
+        "action": action,
+        "resource_type": resource_type,
+        "resource_id": resource_id,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+        "success": success,
+        "details": details,
+        "error_message": error_message,
+        "phi_accessed": phi_accessed,
+        "trace_id": trace_id,
+    }
+
+
+class AuditLogWriter:
+    """
+    Buffers audit records and inserts them in batches off the request path.
+    The queue is bounded, so a slow database applies backpressure instead of
+    growing memory; while the writer isn't running records are inserted directly.
+    """
+    
+    def __init__(
+        self,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL_SECONDS,
+        maxsize: int = AUDIT_QUEUE_MAXSIZE,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue[Optional[Dict[str, Any]]] = asyncio.Queue(maxsize)
+        self._task: Optional[asyncio.Task] = None
+        self._accepting = False
+    
+    async def enqueue(self, record: Dict[str, Any]) -> None:
+        if not self._accepting:
+            await self._write([record])
+            return
+        await self._queue.put(record)
+    
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            self._accepting = True
+    
+    async def stop(self) -> None:
+        """Flush everything queued so far and stop the writer task."""
+        if self._task is None:
+            return
+        # Anything enqueued from here on is written directly
+        self._accepting = False
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        
+        while not stopping:
+            record = await self._queue.get()
+            if record is None:
+                break
+            
+            batch = [record]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    record = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if record is None:
+                    stopping = True
+                    break
+                batch.append(record)
+            
+            await self._write(batch)
+    
+    async def _insert(self, batch: List[Dict[str, Any]]) -> None:
+        async with AsyncSessionLocal() as session:
+            await session.execute(insert(AuditLog), batch)
+            await session.commit()
+    
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        for attempt in range(AUDIT_WRITE_ATTEMPTS):
+            try:
+                await self._insert(batch)
+                logger.info("Audit logs written", count=len(batch))
+                return
+            except Exception as e:
+                logger.warning(
+                    "Audit log batch write failed",
+                    error=str(e),
+                    count=len(batch),
+                    attempt=attempt + 1,
+                )
+                if attempt + 1 < AUDIT_WRITE_ATTEMPTS:
+                    await asyncio.sleep(AUDIT_RETRY_BACKOFF_SECONDS * 2 ** attempt)
+        
+        # Fall back to row-by-row inserts so one bad record can't sink the batch
+        for record in batch:
+            try:
+                await self._insert([record])
+            except Exception as e:
+                logger.error(
+                    "Failed to write audit log",
+                    error=str(e),
+                    event_id=record["event_id"],
+                    action=record["action"],
+                    resource_type=record["resource_type"],
+                    resource_id=str(record["resource_id"]),
+                    actor_id=str(record["actor_id"]),
+                    phi_accessed=record["phi_accessed"],
+                )
+
+
+audit_writer = AuditLogWriter()
+
 
 class AuditService:
     def __init__(self, db: AsyncSession):
@@ -28,46 +178,24 @@ class AuditService:
         phi_accessed: bool = False,
         trace_id: Optional[str] = None,
         user_agent: Optional[str] = None,
-    ) -> AuditLog:
-        try:
-            audit_log = AuditLog(
-                event_id=f"{action}_{resource_type}_{datetime.utcnow().timestamp()}",
-                timestamp=datetime.utcnow(),
+    ) -> None:
+        """Queue an audit event for the batched writer; PHI events included."""
+        await audit_writer.enqueue(
+            build_audit_record(
                 actor_id=actor_id,
                 actor_type=actor_type,
                 action=action,
                 resource_type=resource_type,
                 resource_id=resource_id,
                 ip_address=ip_address,
-                user_agent=user_agent,
                 success=success,
                 details=details,
                 error_message=error_message,
                 phi_accessed=phi_accessed,
                 trace_id=trace_id,
+                user_agent=user_agent,
             )
-            
-            self.db.add(audit_log)
-            await self.db.commit()
-            
-            logger.info(
-                "Audit log created",
-                event_id=audit_log.event_id,
-                action=action,
-                resource_type=resource_type,
-                actor_id=str(actor_id),
-            )
-            
-            return audit_log
-            
-        except Exception as e:
-            logger.error(
-                "Failed to create audit log",
-                error=str(e),
-                action=action,
-                resource_type=resource_type,
-            )
-            raise
+        )
     
     async def log_phi_access(
         self,
@@ -77,8 +205,8 @@ class AuditService:
         action: str,
         ip_address: str,
         trace_id: Optional[str] = None,
-    ) -> AuditLog:
-        return await self.log_event(
+    ) -> None:
+        await self.log_event(
             actor_id=actor_id,
             actor_type=actor_type,
             action=action,
@@ -96,8 +224,8 @@ class AuditService:
         consent_given: bool,
         ip_address: str,
         trace_id: Optional[str] = None,
-    ) -> AuditLog:
-        return await self.log_event(
+    ) -> None:
+        await self.log_event(
             actor_id=patient_id,
             actor_type="patient",
             action="consent_recorded",
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional, List
 import boto3
 from botocore.exceptions import ClientError
@@ -24,6 +25,10 @@ class NotificationService:
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
         )
     
+    def close(self) -> None:
+        self.ses_client.close()
+        self.sns_client.close()
+    
     async def send_email(
         self,
         to_email: str,
@@ -32,7 +37,9 @@ class NotificationService:
         body_html: Optional[str] = None,
     ) -> bool:
         try:
-            response = self.ses_client.send_email(
+            # boto3 is blocking; keep the network round-trip off the event loop
+            response = await asyncio.to_thread(
+                self.ses_client.send_email,
                 Source=settings.AWS_SES_FROM_EMAIL,
                 Destination={"ToAddresses": [to_email]},
                 Message={
@@ -68,7 +75,8 @@ class NotificationService:
             if not phone.startswith("+"):
                 phone = f"+91{phone}"
             
-            response = self.sns_client.publish(
+            response = await asyncio.to_thread(
+                self.sns_client.publish,
                 PhoneNumber=phone,
                 Message=message,
             )
@@ -107,30 +115,35 @@ class NotificationService:
         else:
             message += "Please arrive 10 minutes early."
         
-        sms_sent = await self.send_sms(patient_phone, message)
+        if not patient_email:
+            return await self.send_sms(patient_phone, message)
         
-        email_sent = False
-        if patient_email:
-            email_body = (
-                f"Dear Patient,\n\n"
-                f"This is a reminder for your upcoming appointment:\n\n"
-                f"Provider: Dr. {provider_name}\n"
-                f"Date & Time: {appointment_time}\n"
-                f"Type: {appointment_type.capitalize()}\n"
-            )
-            
-            if appointment_type == "virtual" and zoom_link:
-                email_body += f"Zoom Link: {zoom_link}\n"
-            
-            email_body += (
-                f"\nPlease complete your intake form if you haven't already.\n\n"
-                f"Best regards,\nBaymax Health Team"
-            )
-            
-            email_sent = await self.send_email(
+        email_body = (
+            f"Dear Patient,\n\n"
+            f"This is a reminder for your upcoming appointment:\n\n"
+            f"Provider: Dr. {provider_name}\n"
+            f"Date & Time: {appointment_time}\n"
+            f"Type: {appointment_type.capitalize()}\n"
+        )
+        
+        if appointment_type == "virtual" and zoom_link:
+            email_body += f"Zoom Link: {zoom_link}\n"
+        
+        email_body += (
+            f"\nPlease complete your intake form if you haven't already.\n\n"
+            f"Best regards,\nBaymax Health Team"
+        )
+        
+        sms_sent, email_sent = await asyncio.gather(
+            self.send_sms(patient_phone, message),
+            self.send_email(
                 to_email=patient_email,
                 subject="Appointment Reminder - Baymax Health",
                 body_text=email_body,
-            )
+            ),
+        )
         
-        return sms_sent or email_sent
\ No newline at end of file
+        return sms_sent or email_sent
+
+
+notification_service = NotificationService()
@@ -62,7 +62,40 @@ class TestAppointmentsAPI:
         
         assert response.status_code == 409
         assert "already booked" in response.json()["detail"]
-    
+
+    async def test_reschedule_appointment_conflict(
+        self,
+        client: AsyncClient,
+        mock_auth_token,
+        sample_appointment,
+    ):
+        from unittest.mock import patch
+
+        appointment_data = {
+            "patient_id": str(sample_appointment.patient_id),
+            "provider_id": str(sample_appointment.provider_id),
+            "appointment_type": "physical",
+            "scheduled_at": (sample_appointment.scheduled_at + timedelta(hours=1)).isoformat(),
+            "duration_minutes": 30,
+        }
+
+        with patch("app.services.notification.NotificationService.send_sms"):
+            create_response = await client.post(
+                "/api/v1/appointments/",
+                json=appointment_data,
+                headers={"Authorization": f"Bearer {mock_auth_token}"},
+            )
+
+        # Move the new appointment onto the already booked slot
+        response = await client.put(
+            f"/api/v1/appointments/{create_response.json()['id']}",
+            json={"scheduled_at": sample_appointment.scheduled_at.isoformat()},
+            headers={"Authorization": f"Bearer {mock_auth_token}"},
+        )
+
+        assert response.status_code == 409
+        assert "already booked" in response.json()["detail"]
+
     async def test_get_appointment(
         self,
         client: AsyncClient,
@@ -140,6 +173,34 @@ class TestAppointmentsAPI:
         assert len(data) >= 1
         assert any(a["id"] == str(sample_appointment.id) for a in data)
     
+    async def test_list_appointments_single_query(
+        self,
+        client: AsyncClient,
+        db_session,
+        mock_auth_token,
+        sample_appointment,
+    ):
+        from sqlalchemy import event
+        
+        statements = []
+        
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+        
+        sync_engine = db_session.bind.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", count_statement)
+        try:
+            response = await client.get(
+                "/api/v1/appointments/",
+                headers={"Authorization": f"Bearer {mock_auth_token}"},
+            )
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", count_statement)
+        
+        assert response.status_code == 200
+        assert len(statements) == 1
+    
     async def test_list_appointments_by_patient(
         self,
         client: AsyncClient,
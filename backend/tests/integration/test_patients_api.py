@@ -176,6 +176,57 @@ class TestPatientsAPI:
         data = response.json()
         assert len(data) == 5
     
+    async def test_search_patients_cursor_pagination(
+        self,
+        client: AsyncClient,
+        mock_auth_token,
+        db_session,
+    ):
+        from app.models import Patient
+        
+        for i in range(8):
+            patient = Patient(
+                phone=f"987654340{i:02d}",
+                first_name=f"Cursor{i}",
+                last_name="Patient",
+                date_of_birth=date(1990, 1, 1),
+            )
+            db_session.add(patient)
+        await db_session.commit()
+        
+        response = await client.get(
+            "/api/v1/patients/?q=Cursor&limit=5",
+            headers={"Authorization": f"Bearer {mock_auth_token}"},
+        )
+        
+        assert response.status_code == 200
+        first_page = response.json()
+        assert len(first_page) == 5
+        next_cursor = response.headers["X-Next-Cursor"]
+        
+        response = await client.get(
+            f"/api/v1/patients/?q=Cursor&limit=5&cursor={next_cursor}",
+            headers={"Authorization": f"Bearer {mock_auth_token}"},
+        )
+        
+        assert response.status_code == 200
+        second_page = response.json()
+        assert len(second_page) == 3
+        assert "X-Next-Cursor" not in response.headers
+        assert not {p["id"] for p in first_page} & {p["id"] for p in second_page}
+    
+    async def test_search_patients_invalid_cursor(
+        self,
+        client: AsyncClient,
+        mock_auth_token,
+    ):
+        response = await client.get(
+            "/api/v1/patients/?cursor=not-a-cursor",
+            headers={"Authorization": f"Bearer {mock_auth_token}"},
+        )
+        
+        assert response.status_code == 400
+    
     async def test_patient_api_requires_auth(self, client: AsyncClient):
         # Test without auth token
         response = await client.get("/api/v1/patients/")
@@ -1,5 +1,6 @@
 import pytest
 import json
+from uuid import uuid4
 from unittest.mock import patch, AsyncMock
 from fastapi.testclient import TestClient
 
@@ -23,7 +24,7 @@ class TestWebSocketIntake:
                 }
             )
             
-            with client.websocket_connect("/api/v1/intake/ws/test_session") as websocket:
+            with client.websocket_connect(f"/api/v1/intake/ws/{uuid4()}") as websocket:
                 # Send a message
                 websocket.send_json({
                     "type": "text_message",
@@ -51,7 +52,7 @@ class TestWebSocketIntake:
                 }
             )
             
-            with client.websocket_connect("/api/v1/intake/ws/test_session") as websocket:
+            with client.websocket_connect(f"/api/v1/intake/ws/{uuid4()}") as websocket:
                 # Patient describes symptoms
                 websocket.send_json({
                     "type": "text_message",
@@ -79,7 +80,7 @@ class TestWebSocketIntake:
             )
             mock_instance.escalate_red_flag = AsyncMock()
             
-            with client.websocket_connect("/api/v1/intake/ws/emergency_session") as websocket:
+            with client.websocket_connect(f"/api/v1/intake/ws/{uuid4()}") as websocket:
                 # Send emergency symptom
                 websocket.send_json({
                     "type": "text_message",
@@ -115,7 +116,7 @@ class TestWebSocketIntake:
                 }
             )
             
-            with client.websocket_connect("/api/v1/intake/ws/test_session") as websocket:
+            with client.websocket_connect(f"/api/v1/intake/ws/{uuid4()}") as websocket:
                 # Send session end signal
                 websocket.send_json({
                     "type": "end_session",
@@ -136,7 +137,7 @@ class TestWebSocketIntake:
                 side_effect=Exception("Processing error")
             )
             
-            with client.websocket_connect("/api/v1/intake/ws/error_session") as websocket:
+            with client.websocket_connect(f"/api/v1/intake/ws/{uuid4()}") as websocket:
                 # Send message that causes error
                 websocket.send_json({
                     "type": "text_message",
@@ -148,11 +149,37 @@ class TestWebSocketIntake:
                 assert response["type"] == "error"
                 assert "error occurred" in response["message"].lower()
     
+    def test_websocket_msgpack_subprotocol(self):
+        """Test binary msgpack frames when the client negotiates them"""
+        import ormsgpack
+
+        client = TestClient(app)
+
+        with patch("app.api.intake.AIIntakeService") as mock_service:
+            mock_instance = mock_service.return_value
+            mock_instance.process_text_input = AsyncMock(
+                side_effect=Exception("Processing error")
+            )
+
+            with client.websocket_connect(
+                f"/api/v1/intake/ws/{uuid4()}", subprotocols=["msgpack"]
+            ) as websocket:
+                assert websocket.accepted_subprotocol == "msgpack"
+
+                websocket.send_bytes(ormsgpack.packb({
+                    "type": "text_message",
+                    "content": "Test message",
+                    "language": "en",
+                }))
+
+                response = ormsgpack.unpackb(websocket.receive_bytes())
+                assert response["type"] == "error"
+
     def test_websocket_invalid_message_type(self):
         """Test handling of invalid message types"""
         client = TestClient(app)
         
-        with client.websocket_connect("/api/v1/intake/ws/test_session") as websocket:
+        with client.websocket_connect(f"/api/v1/intake/ws/{uuid4()}") as websocket:
             # Send invalid message type
             websocket.send_json({
                 "type": "invalid_type",
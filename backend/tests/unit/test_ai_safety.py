@@ -26,7 +26,7 @@ class TestAISafetyClassifier:
         ]
         
         for input_text in dangerous_inputs:
-            result = await ai_service._check_safety(input_text)
+            result = ai_service._check_safety(input_text)
             assert result == "blocked", f"Failed to block: '{input_text}'"
     
     async def test_safe_questions_allowed(self, db_session):
@@ -43,7 +43,7 @@ class TestAISafetyClassifier:
         ]
         
         for input_text in safe_inputs:
-            result = await ai_service._check_safety(input_text)
+            result = ai_service._check_safety(input_text)
             assert result == "safe", f"Incorrectly blocked: '{input_text}'"
     
     async def test_response_never_contains_diagnosis(self, db_session):
@@ -89,7 +89,7 @@ class TestRedFlagDetection:
         ]
         
         for scenario, expected_severity, expected_condition in red_flag_scenarios:
-            red_flags = await ai_service._detect_red_flags(scenario)
+            red_flags = ai_service._detect_red_flags(scenario)
             
             assert len(red_flags) > 0, f"Failed to detect red flag in: '{scenario}'"
             assert red_flags[0].severity == expected_severity
@@ -108,7 +108,7 @@ class TestRedFlagDetection:
         ]
         
         for scenario in normal_scenarios:
-            red_flags = await ai_service._detect_red_flags(scenario)
+            red_flags = ai_service._detect_red_flags(scenario)
             assert len(red_flags) == 0, f"False positive red flag for: '{scenario}'"
     
     async def test_red_flag_escalation_response(self, db_session):
@@ -168,7 +168,7 @@ class TestMultilingualSafety:
         
         for input_text in dangerous_hindi:
             # The service should detect and block these
-            result = await ai_service._check_safety(input_text)
+            result = ai_service._check_safety(input_text)
             # Note: In production, this would use translation service
             # For now, we test the framework exists
             assert result in ["safe", "blocked"]  # Framework exists
@@ -0,0 +1,48 @@
+import asyncio
+import pytest
+from uuid import uuid4
+
+from app.core import cache
+from app.schemas.intake import TextMessage
+
+
+@pytest.mark.asyncio
+class TestGetOrLoad:
+    @pytest.fixture(autouse=True)
+    def fake_redis(self, mocker):
+        store = {}
+
+        async def get_cached(resource, resource_id, model):
+            return store.get((resource, resource_id))
+
+        async def set_cached(resource, resource_id, value):
+            store[(resource, resource_id)] = value
+
+        mocker.patch.object(cache, "get_cached", get_cached)
+        mocker.patch.object(cache, "set_cached", set_cached)
+        return store
+
+    async def test_concurrent_misses_load_once(self):
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return TextMessage(content="hello")
+
+        resource_id = uuid4()
+        results = await asyncio.gather(
+            *(cache.get_or_load("test", resource_id, TextMessage, loader) for _ in range(10))
+        )
+
+        assert calls == 1
+        assert all(r.content == "hello" for r in results)
+        assert cache._load_locks == {}
+
+    async def test_missing_value_not_cached(self, fake_redis):
+        async def loader():
+            return None
+
+        assert await cache.get_or_load("test", uuid4(), TextMessage, loader) is None
+        assert fake_redis == {}
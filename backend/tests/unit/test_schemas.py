@@ -123,7 +123,19 @@ class TestAppointmentSchemas:
         with pytest.raises(ValidationError) as exc_info:
             AppointmentCreate(**appointment_data)
         assert "past" in str(exc_info.value).lower()
-    
+
+    def test_appointment_create_timezone_aware_past_date(self):
+        import uuid
+        appointment_data = {
+            "patient_id": str(uuid.uuid4()),
+            "provider_id": str(uuid.uuid4()),
+            "scheduled_at": "2020-01-01T09:00:00+05:30",
+            "duration_minutes": 30,
+        }
+        with pytest.raises(ValidationError) as exc_info:
+            AppointmentCreate(**appointment_data)
+        assert "past" in str(exc_info.value).lower()
+
     def test_appointment_create_invalid_duration(self):
         import uuid
         from datetime import timedelta
@@ -6,8 +6,12 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     verify_token,
+    verify_token_cached,
+    clear_token_cache,
     verify_password,
     get_password_hash,
+    averify_password,
+    aget_password_hash,
     generate_otp,
     hash_otp,
     verify_otp,
@@ -62,6 +66,43 @@ class TestJWTTokens:
         assert verified_subject is None
 
 
+class TestTokenCache:
+    def setup_method(self):
+        clear_token_cache()
+    
+    def test_cached_verify_returns_subject(self):
+        token = create_access_token(subject="test_user_id")
+        
+        assert verify_token_cached(token) == "test_user_id"
+        assert verify_token_cached(token) == "test_user_id"
+    
+    def test_cached_verify_skips_decode_on_hit(self, mocker):
+        token = create_access_token(subject="test_user_id")
+        verify_token_cached(token)
+        
+        decode = mocker.patch("app.core.security.jwt.decode")
+        assert verify_token_cached(token) == "test_user_id"
+        decode.assert_not_called()
+    
+    def test_cached_verify_rejects_invalid_token(self):
+        assert verify_token_cached("invalid_token") is None
+        assert verify_token_cached("invalid_token") is None
+    
+    def test_cached_verify_respects_token_type(self):
+        token = create_access_token(subject="test_user_id")
+        
+        assert verify_token_cached(token, token_type="access") == "test_user_id"
+        assert verify_token_cached(token, token_type="refresh") is None
+    
+    def test_nearly_expired_token_not_cached(self, mocker):
+        token = create_access_token(subject="test_user_id", expires_delta=timedelta(seconds=2))
+        verify_token_cached(token)
+        
+        decode = mocker.patch("app.core.security.jwt.decode", side_effect=JWTError())
+        assert verify_token_cached(token) is None
+        decode.assert_called_once()
+
+
 class TestPasswordHashing:
     def test_password_hash_and_verify(self):
         password = "Test@1234"
@@ -85,6 +126,14 @@ class TestPasswordHashing:
         assert hash1 != hash2  # Bcrypt uses salt
         assert verify_password(password, hash1) is True
         assert verify_password(password, hash2) is True
+    
+    @pytest.mark.asyncio
+    async def test_async_hash_and_verify(self):
+        password = "Test@1234"
+        hashed = await aget_password_hash(password)
+        
+        assert await averify_password(password, hashed) is True
+        assert await averify_password("Wrong@1234", hashed) is False
 
 
 class TestOTP:
@@ -138,7 +187,7 @@ class TestPHIEncryption:
         encrypted1 = phi_encryption.encrypt(data)
         encrypted2 = phi_encryption.encrypt(data)
         
-        # Fernet includes timestamp, so same data encrypts differently
+        # Each encryption uses a fresh random nonce
         assert encrypted1 != encrypted2
         
         # But both decrypt to same value
@@ -147,4 +196,16 @@ class TestPHIEncryption:
     
     def test_decrypt_invalid_data(self):
         with pytest.raises(Exception):
-            phi_encryption.decrypt("invalid_encrypted_data")
\ No newline at end of file
+            phi_encryption.decrypt("invalid_encrypted_data")
+    
+    def test_decrypt_legacy_fernet_token(self):
+        legacy = phi_encryption.cipher.encrypt(b"Patient data").decode()
+        
+        assert phi_encryption.decrypt(legacy) == "Patient data"
+    
+    def test_encrypt_many(self):
+        data = ["first", "second", "third"]
+        
+        encrypted = phi_encryption.encrypt_many(data)
+        
+        assert [phi_encryption.decrypt(e) for e in encrypted] == data
\ No newline at end of file